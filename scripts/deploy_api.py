@@ -1,4 +1,9 @@
-from fastapi import FastAPI
+from typing import Any
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
+import orjson
+import httpx
+from starlette.concurrency import run_in_threadpool
 # Set project root to path
 import sys
 from pathlib import Path
@@ -15,21 +20,67 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 print(f"Project root added to path: {project_root}")
-from src.models.forecaster import EnergyForecaster
-from src.data.data_loader import EntsoeClient
-import uvicorn
+from src.api.batching import PredictBatcher
+from src.config import MODEL_PATH
 from fastapi.middleware.cors import CORSMiddleware
 from datetime import datetime
 
-app = FastAPI()
-forecaster = EnergyForecaster()
+class NumpyORJSONResponse(ORJSONResponse):
+    """ORJSONResponse that serializes numpy arrays natively on every FastAPI version"""
 
-# Train the model with some dummy data for testing
-dates = pd.date_range(start='2024-01-01', periods=24, freq='h')
-training_data = pd.DataFrame({
-    'load': [50000 + np.random.normal(0, 1000) for _ in range(24)]
-}, index=dates)
-forecaster.train(training_data)  # Train the model before using it
+    def render(self, content: Any) -> bytes:
+        # FastAPI 0.68's ORJSONResponse calls orjson.dumps without options,
+        # which rejects numpy arrays
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+app = FastAPI(default_response_class=NumpyORJSONResponse)
+
+# Populated by the startup handler so the heavy model and ENTSO-E imports
+# happen inside each worker rather than at import time
+forecaster = None
+batcher = None
+client = None
+http_client = None
+
+@app.on_event("startup")
+async def load_forecaster():
+    """Load the model and data client on startup so importing the app stays cheap"""
+    global forecaster, batcher, client, http_client
+    from src.models.forecaster import EnergyForecaster
+    
+    if MODEL_PATH.exists():
+        # Pre-trained with `python -m src.models.train`
+        forecaster = await run_in_threadpool(EnergyForecaster.load, MODEL_PATH)
+    else:
+        # Fall back to training on some dummy data for testing
+        forecaster = EnergyForecaster()
+        dates = pd.date_range(start='2024-01-01', periods=24, freq='h')
+        training_data = pd.DataFrame({
+            'load': np.random.normal(50000, 1000, size=24)
+        }, index=dates)
+        await run_in_threadpool(forecaster.train, training_data)
+    
+    batcher = PredictBatcher(forecaster.predict_batch)
+    
+    # Only initialize EntsoeClient if API key is available; the single
+    # instance is shared by all endpoints
+    api_key = os.getenv('ENTSOE_API_KEY')
+    if api_key:
+        from src.data.clients.entsoe_client import EntsoeClient
+        client = EntsoeClient(api_key=api_key)
+        # One pooled connection to ENTSO-E per worker instead of a handshake per request
+        http_client = httpx.AsyncClient(timeout=30)
+    else:
+        client = None
+    
+    batcher.start()
+
+@app.on_event("shutdown")
+async def stop_batcher():
+    if batcher is not None:
+        await batcher.stop()
+    if http_client is not None:
+        await http_client.aclose()
 
 # Enable CORS
 app.add_middleware(
@@ -39,40 +90,51 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Only initialize EntsoeClient if API key is available
-try:
-    from src.data.entsoe_client import EntsoeClient
-    api_key = os.getenv('ENTSOE_API_KEY')
-    if api_key:
-        client = EntsoeClient(api_key=api_key)
-    else:
-        client = None
-except ImportError:
-    client = None
-
 @app.get("/api/latest-forecast")
 async def get_latest_forecast():
     if client:
         # Use real ENTSOE data if client is available
-        actual_load, forecast_load = client.get_load_data()
+        from entsoe.exceptions import NoMatchingDataError
+        try:
+            latest = await client.get_latest_load_async(http_client)
+        except NoMatchingDataError:
+            raise HTTPException(status_code=404, detail="No load data published for the last 24 hours")
+        actual_load = latest['Actual Load']
+        forecast_load = latest['Forecasted Load'].to_numpy()
     else:
         # Use mock data for testing
         dates = pd.date_range(start='2024-01-01', periods=24, freq='h')
         mock_data = pd.DataFrame({
-            'load': [50000 + i * 1000 for i in range(24)]
+            'load': 50000 + 1000 * np.arange(24)
         }, index=dates)
         actual_load = mock_data['load']
-        forecast_load = [x * 1.1 for x in actual_load]  # Mock forecast
+        forecast_load = actual_load.to_numpy() * 1.1  # Mock forecast
     
-    # Generate model forecasts using the trained model
-    model_forecast = forecaster.predict(mock_data)
+    # Generate model forecasts using the trained model; concurrent requests
+    # are combined into a single predict call by the batcher
+    features = forecaster.prepare_features(actual_load)
+    model_forecast = await batcher.submit(features)
     
-    return {
-        "actual_load": actual_load.tolist(),
+    # Returning the response directly skips jsonable_encoder; orjson
+    # serializes the numpy arrays natively
+    return NumpyORJSONResponse({
+        "actual_load": actual_load.to_numpy(),
         "entsoe_forecast": forecast_load,
-        "model_forecast": model_forecast.tolist(),
+        "model_forecast": model_forecast,
         "timestamp": datetime.now().isoformat()
-    }
+    })
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    import uvicorn
+    
+    # Workers are separate processes, so uvicorn needs an import string and
+    # each worker loads its own model in the startup handler
+    workers = int(os.getenv('WEB_CONCURRENCY', 2 * (os.cpu_count() or 1) + 1))
+    uvicorn.run(
+        "scripts.deploy_api:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=workers,
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools"
+    )
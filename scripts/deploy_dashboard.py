@@ -7,7 +7,7 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 if __name__ == '__main__':
-    logger.info(f"Starting production server on port {Config.DASHBOARD_PORT}")
+    logger.info("Starting production server on port %s", Config.DASHBOARD_PORT)
     serve(
         app.server,
         host='0.0.0.0',  # Allow external connections
@@ -15,9 +15,13 @@ setup(
         # Data Processing
         "pandas==2.1.4",
         "numpy>=1.26.0",
+        "pyarrow>=15.0.0",
+        "polars>=1.0.0",
         "python-dotenv==1.0.0",
         "entsoe-py==0.5.10",
         "holidays==0.65",
+        "bottleneck>=1.3.6",
+        "cachetools==5.5.1",
         
         # Machine Learning
         "lightgbm==4.5.0",
@@ -34,7 +38,11 @@ setup(
         "matplotlib==3.10.0",
         "seaborn==0.13.2",
         "fastapi",
+        "orjson",
         "httpx",
+        "uvicorn",
+        "uvloop; sys_platform != 'win32'",
+        "httptools",
         "pytest",
         "pytest-cov"
     ],
@@ -0,0 +1,99 @@
+import asyncio
+import logging
+from typing import Callable, Optional
+
+import numpy as np
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+class PredictBatcher:
+    """Collect concurrent predict requests into micro-batches for a single model call"""
+
+    def __init__(
+        self,
+        predict_fn: Callable[[np.ndarray], np.ndarray],
+        max_batch: int = 64,
+        max_wait: float = 0.01
+    ):
+        """
+        Args:
+            predict_fn (Callable): Predicts on a 2D float32 feature matrix
+            max_batch (int): Maximum number of requests combined into one call
+            max_wait (float): Seconds to wait for more requests after the first
+        """
+        self.predict_fn = predict_fn
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the background batching task on the running event loop"""
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background batching task"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def submit(self, features: np.ndarray) -> np.ndarray:
+        """
+        Queue a feature matrix and wait for its predictions
+
+        Args:
+            features (np.ndarray): 2D feature matrix for one request
+
+        Returns:
+            np.ndarray: Predictions, one per feature row
+
+        Raises:
+            RuntimeError: If the batching task is not running
+        """
+        if self._task is None or self._task.done():
+            raise RuntimeError("Prediction batcher is not running")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((features, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Drain the queue into batches and fan results back out"""
+        loop = asyncio.get_running_loop()
+        while True:
+            items = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(items) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    items.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Any failure fails this batch only; the loop must keep serving later requests
+            try:
+                batch = np.ascontiguousarray(
+                    np.concatenate([features for features, _ in items]),
+                    dtype=np.float32
+                )
+                predictions = await run_in_threadpool(self.predict_fn, batch)
+                offsets = np.cumsum([len(features) for features, _ in items])[:-1]
+                results = np.split(predictions, offsets)
+            except Exception as e:
+                logger.error("Batched prediction failed: %s", e)
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(items, results):
+                if not future.done():
+                    future.set_result(result)
@@ -1,6 +1,7 @@
 from pathlib import Path
 from typing import Dict, Any
 import os
+from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -11,6 +12,7 @@ ROOT_DIR = Path(__file__).parent.parent  # Gets the project root directory
 DATA_DIR = ROOT_DIR / 'data'
 RAW_DATA_PATH = DATA_DIR / 'raw'
 CACHE_DIR = DATA_DIR / 'cache'
+MODEL_PATH = Path(os.getenv("MODEL_PATH", ROOT_DIR / 'models' / 'forecaster.txt'))
 
 # API Settings
 API_HOST = "0.0.0.0"
@@ -23,6 +25,7 @@ DASHBOARD_PORT = 8050
 # Data Settings
 COUNTRY_CODE = "DE"
 TIMEZONE = "Europe/Berlin"
+TZ = ZoneInfo(TIMEZONE)
 
 # API Keys
 ENTSOE_API_KEY = os.getenv("ENTSOE_API_KEY")
@@ -46,6 +49,7 @@ class Config:
     
     # Ensure directories exist
     DATA_DIR.mkdir(exist_ok=True)
+    RAW_DATA_PATH.mkdir(exist_ok=True)
     CACHE_DIR.mkdir(exist_ok=True)
 
 # # src/config.py
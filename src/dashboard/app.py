@@ -1,14 +1,13 @@
 import sys
 from pathlib import Path
-import pytz
 from datetime import datetime, timedelta
-import pandas as pd
+import numpy as np
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent.parent
 sys.path.append(str(project_root))
 
-from dash import Dash, dcc, html
+from dash import Dash, dcc, html, Patch, no_update
 from dash.dependencies import Input, Output
 import plotly.graph_objects as go
 import requests
@@ -16,8 +15,8 @@ import logging
 import dash
 import dash_bootstrap_components as dbc
 
-from src.data.data_loader import EntsoeClient
-from src.config import Config
+from src.config import Config, TZ
+from src.dashboard.cache import get_cached_data
 
 # Setup logging
 logging.basicConfig(
@@ -37,17 +36,6 @@ app = dash.Dash(
 )
 server = app.server
 
-try:
-    # Initialize data client
-    client = EntsoeClient(
-        api_key=Config.ENTSOE_API_KEY,
-        country_code=Config.COUNTRY_CODE
-    )
-    logger.info("Successfully initialized EntsoeClient")
-except Exception as e:
-    logger.error(f"Failed to initialize EntsoeClient: {str(e)}")
-    raise
-
 # Add logging configuration
 logging.basicConfig(
     filename='dashboard.log',
@@ -55,6 +43,64 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# Static chart layout, validated by plotly once at import
+BASE_LAYOUT = go.Layout(
+    template='plotly_dark',
+    paper_bgcolor='#1a1a1a',
+    plot_bgcolor='#1a1a1a',
+    height=450,
+    margin=dict(l=30, r=30, t=20, b=50),
+    xaxis=dict(
+        title="Time",
+        title_font=dict(size=16),
+        tickfont=dict(size=12),
+        gridcolor='#2f3338'
+    ),
+    yaxis=dict(
+        title="Load [MW]",
+        title_font=dict(size=16),
+        tickfont=dict(size=12),
+        gridcolor='#2f3338'
+    ),
+    hovermode='x unified',
+
+    showlegend=True,
+    legend=dict(
+        font=dict(size=16),
+        yanchor="top",
+        y=0.99,
+        xanchor="right",
+        x=0.99,
+        bgcolor='rgba(26,26,26,0.8)'
+    )
+)
+
+def create_base_figure():
+    """Build the load chart once; callbacks only patch its traces and x-range"""
+    return go.Figure(
+        data=[
+            go.Scatter(
+                x=[],
+                y=[],
+                name='Actual Load',
+                line=dict(color='#00bbec', width=2)
+            ),
+            go.Scatter(
+                x=[],
+                y=[],
+                name='Forecast Load',
+                line=dict(color='#ff9f1c', width=2, dash='dash')
+            )
+        ],
+        layout=BASE_LAYOUT
+    )
+
+def to_local_times(index):
+    """Convert a DatetimeIndex to a datetime64 array of Berlin wall-clock times"""
+    if index.tz is not None:
+        index = index.tz_convert(TZ).tz_localize(None)
+    return index.to_numpy(dtype='datetime64[ns]')
+
 # Define the layout
 app.layout = html.Div([
     #html.H1("German Energy Load Dashboard"),
@@ -70,7 +116,12 @@ app.layout = html.Div([
         dcc.Loading(
             id="loading-1",
             type="default",
-            children=dcc.Graph(id='load-chart')
+            children=dcc.Graph(
+                id='load-chart',
+                figure=create_base_figure(),
+                config={'displayModeBar': False},
+                responsive=True
+            )
         ),
         
         # html.Div([
@@ -99,75 +150,36 @@ app.layout = html.Div([
 def update_dashboard(n):
     try:
         logger.info("Fetching new data...")
-        actual_load, forecast_load = client.get_load_data(
+        # Shared by all viewers; concurrent callbacks wait for a single upstream fetch
+        actual_load, forecast_load = get_cached_data(
             hours_back=48,
             forecast_hours=24
         )
         
-        # Create figure
-        fig = go.Figure()
+        # Only the trace data and x-range change; the layout stays in the browser
+        fig = Patch()
         
         # Get current time using datetime
-        now = datetime.now(pytz.timezone("Europe/Berlin"))
-        now_ts = pd.Timestamp(now)
+        now = datetime.now(TZ)
         
-        # Add actual load trace
-        if not actual_load.empty:
-            fig.add_trace(go.Scatter(
-                x=actual_load.index,
-                y=actual_load.values,
-                name='Actual Load',
-                line=dict(color='#00bbec', width=2)
-            ))
+        # Read each series once as plain arrays of Berlin wall-clock times
+        a_idx, a_val = to_local_times(actual_load.index), actual_load.to_numpy()
+        f_idx, f_val = to_local_times(forecast_load.index), forecast_load.to_numpy()
         
-        # Add forecast load trace (only future values)
-        if not forecast_load.empty:
-            #future_forecast = forecast_load[forecast_load.index >= now_ts]
-            #if not forecast_load.empty:
-            fig.add_trace(go.Scatter(
-                x=forecast_load.index,
-                y=forecast_load.values,
-                name='Forecast Load',
-                line=dict(color='#ff9f1c', width=2, dash='dash')
-            ))
+        # Update actual load trace
+        fig['data'][0]['x'] = a_idx
+        fig['data'][0]['y'] = a_val
         
-        # Calculate x-axis range using timedelta
-        x_min = actual_load.index.min() if not actual_load.empty else pd.Timestamp(now - timedelta(hours=48))
-        x_max = forecast_load.index.max() if not forecast_load.empty else pd.Timestamp(now + timedelta(hours=24))
+        # Update forecast load trace
+        #future_forecast = forecast_load[forecast_load.index >= now_ts]
+        fig['data'][1]['x'] = f_idx
+        fig['data'][1]['y'] = f_val
         
-        # Update layout
-        fig.update_layout(
-            template='plotly_dark',
-            paper_bgcolor='#1a1a1a',
-            plot_bgcolor='#1a1a1a',
-            height=450,
-            margin=dict(l=30, r=30, t=20, b=50),
-            xaxis=dict(
-                title="Time",
-                title_font=dict(size=16),
-                tickfont=dict(size=12),
-                gridcolor='#2f3338',
-                range=[x_min, x_max]
-
-            ),
-            yaxis=dict(
-                title="Load [MW]",
-                title_font=dict(size=16),
-                tickfont=dict(size=12),
-                gridcolor='#2f3338'
-            ),
-            hovermode='x unified',
-
-            showlegend=True,
-            legend=dict(
-                font=dict(size=16),
-                yanchor="top",
-                y=0.99,
-                xanchor="right",
-                x=0.99,
-                bgcolor='rgba(26,26,26,0.8)'
-            )
-        )
+        # Calculate x-axis range using timedelta; both indexes are sorted
+        local_now = now.replace(tzinfo=None)
+        x_min = a_idx[0] if len(a_idx) else np.datetime64(local_now - timedelta(hours=48))
+        x_max = f_idx[-1] if len(f_idx) else np.datetime64(local_now + timedelta(hours=24))
+        fig['layout']['xaxis']['range'] = [x_min, x_max]
         
         # # Format values with proper timezone handling
         # current_load = html.Div([
@@ -192,17 +204,15 @@ def update_dashboard(n):
         return fig, last_update, "" , #current_load, forecast_load, 
         
     except Exception as e:
-        logger.error(f"Error updating dashboard: {str(e)}")
+        logger.error("Error updating dashboard: %s", e)
         return (
-            go.Figure(),
-            "Data unavailable",
-            "Data unavailable",
+            no_update,
             f"Last update failed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
             f"Error: {str(e)}"
         )
 
 if __name__ == '__main__':
-    logger.info(f"Starting dashboard on {Config.DASHBOARD_HOST}:{Config.DASHBOARD_PORT}")
+    logger.info("Starting dashboard on %s:%s", Config.DASHBOARD_HOST, Config.DASHBOARD_PORT)
     app.run_server(
         host=Config.DASHBOARD_HOST,
         port=Config.DASHBOARD_PORT,
@@ -1,19 +1,48 @@
-from functools import lru_cache
-from datetime import datetime, timedelta
+import threading
 
+from cachetools import TTLCache
 
-from src.dashboard.config import Config
-from src.dashboard.entsoe_client import EntsoeClient
+from src.config import Config
+from src.data.clients.entsoe_client import EntsoeClient
 
 
+CACHE_TTL = 300  # seconds
 
-@lru_cache(maxsize=1)
-def get_cached_data(timestamp_key):
-    """Cache data for 5 minutes using timestamp as key"""
-    client = EntsoeClient(api_key=Config.ENTSOE_API_KEY)
-    return client.get_load_data()
+_cache = TTLCache(maxsize=8, ttl=CACHE_TTL)
+_inflight = {}
+_lock = threading.Lock()
 
-def get_timestamp_key():
-    """Generate key based on 5-minute intervals"""
-    now = datetime.now()
-    return now.replace(second=0, microsecond=0).strftime('%Y%m%d%H%M') 
\ No newline at end of file
+
+def get_cached_data(hours_back=48, forecast_hours=24):
+    """Cache load data for 5 minutes, with at most one upstream fetch in flight per window"""
+    key = (hours_back, forecast_hours)
+    with _lock:
+        if key in _cache:
+            return _cache[key]
+        event = _inflight.get(key)
+        is_leader = event is None
+        if is_leader:
+            event = _inflight[key] = threading.Event()
+
+    if not is_leader:
+        # Another caller is already fetching; wait for its result
+        event.wait()
+        with _lock:
+            if key in _cache:
+                return _cache[key]
+        # The leading fetch failed, so try again ourselves
+        return get_cached_data(hours_back, forecast_hours)
+
+    try:
+        client = EntsoeClient(api_key=Config.ENTSOE_API_KEY, country_code=Config.COUNTRY_CODE)
+        data = client.get_load_data(
+            hours_back=hours_back,
+            forecast_hours=forecast_hours
+        )
+        with _lock:
+            _cache[key] = data
+        return data
+    finally:
+        with _lock:
+            del _inflight[key]
+        event.set()
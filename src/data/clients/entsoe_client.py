@@ -1,44 +1,70 @@
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 import pandas as pd
-import pytz
 from datetime import datetime, timedelta
-import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import requests
+import httpx
 import logging
 from pathlib import Path
 from entsoe import EntsoePandasClient
+from entsoe.entsoe import URL as ENTSOE_URL
 from entsoe.exceptions import NoMatchingDataError
+from entsoe.mappings import lookup_area
+from entsoe.parsers import parse_loads
 from tqdm import tqdm
+from cachetools import TTLCache
 
-from src.config import ENTSOE_API_KEY, COUNTRY_CODE, RAW_DATA_PATH
-from src.data.utils import save_data
+from src.config import ENTSOE_API_KEY, COUNTRY_CODE, RAW_DATA_PATH, TZ
+from src.data.utils import save_data, create_session, split_date_range, backoff_delay, get_cache_path, read_cache, write_cache
 
 logger = logging.getLogger(__name__)
 
+LOAD_CACHE_TTL = 24 * 3600  # seconds
+LATEST_CACHE_TTL = 300  # seconds
+
+# Shared across clients so API requests within 5 minutes reuse one fetch per country;
+# only touched from the event loop, so no lock is needed
+_latest_cache = TTLCache(maxsize=8, ttl=LATEST_CACHE_TTL)
+_latest_inflight: Dict[str, asyncio.Task] = {}
+
 class EntsoeClient:
     """Client for fetching load data from ENTSO-E"""
     
-    def __init__(self, api_key: str = ENTSOE_API_KEY, country_code: str = COUNTRY_CODE):
-        """Initialize ENTSO-E client with API key and country code"""
-        self.client = EntsoePandasClient(api_key=api_key)
+    __slots__ = ('max_retries', 'session', 'client', 'country_code', 'tz')
+    
+    def __init__(
+        self,
+        api_key: str = ENTSOE_API_KEY,
+        country_code: str = COUNTRY_CODE,
+        max_retries: int = 3
+    ):
+        """Initialize ENTSO-E client with API key, country code and a pooled retrying session"""
+        self.max_retries = max_retries
+        self.session = create_session(max_retries=max_retries)
+        # The session's Retry is the only retry layer; entsoe-py's own @retry would
+        # repeat each attempt with fixed 10 s sleeps on top of it
+        self.client = EntsoePandasClient(api_key=api_key, session=self.session, retry_count=1)
         self.country_code = country_code
-        self.tz = pytz.timezone('Europe/Berlin')
+        self.tz = TZ
     
     def fetch_load_data(
         self,
         start_date: str,
         end_date: str,
         chunk_size: int = 30,
-        max_retries: int = 3
+        max_workers: int = 4,
+        cache_ttl: Optional[float] = LOAD_CACHE_TTL
     ) -> pd.DataFrame:
         """
-        Fetch load data from ENTSO-E in chunks with retry logic
+        Fetch load data from ENTSO-E in chunks
         
         Args:
             start_date (str): Start date in format YYYYMMDD
             end_date (str): End date in format YYYYMMDD
             chunk_size (int): Number of days per request
-            max_retries (int): Maximum number of retry attempts
+            max_workers (int): Number of chunks fetched concurrently
+            cache_ttl (float, optional): Maximum age in seconds of a cached result
         
         Returns:
             pd.DataFrame: Combined load data for the entire period
@@ -52,51 +78,35 @@ class EntsoeClient:
             if not (len(start_date) == 8 and len(end_date) == 8):
                 raise ValueError("Dates must be in YYYYMMDD format")
             
-            start = self.tz.localize(datetime.strptime(start_date, '%Y%m%d'))
-            end = self.tz.localize(datetime.strptime(end_date, '%Y%m%d'))
+            start = datetime.strptime(start_date, '%Y%m%d').replace(tzinfo=self.tz)
+            end = datetime.strptime(end_date, '%Y%m%d').replace(tzinfo=self.tz)
             
             # Validate date range
             if end <= start:
                 raise ValueError("End date must be after start date")
             
-            # Calculate number of chunks
-            total_days = (end - start).days
-            num_chunks = (total_days + chunk_size - 1) // chunk_size
+            # Serve repeated requests from the parquet cache
+            cache_file = get_cache_path('load', self.country_code, start_date, end_date)
+            cached = read_cache(cache_file, ttl=cache_ttl)
+            if cached is not None:
+                return cached
+            
+            # Split the period into chunks
+            chunks = split_date_range(start, end, chunk_size)
             
             all_data = []
-            current_start = start
-            
-            # Create progress bar for chunks
-            with tqdm(total=num_chunks, desc="Fetching Load Data") as pbar:
-                while current_start < end:
-                    current_end = min(current_start + timedelta(days=chunk_size), end)
-                    
-                    for attempt in range(max_retries):
-                        try:
-                            logger.info(f"Fetching data from {current_start} to {current_end}")
-                            chunk_data = self.client.query_load_and_forecast(
-                                country_code=self.country_code,
-                                start=pd.Timestamp(current_start),
-                                end=pd.Timestamp(current_end)
-                            )
-                            
-                            if not chunk_data.empty:
-                                all_data.append(chunk_data)
-                                break
-                                
-                        except NoMatchingDataError:
-                            logger.warning(f"No data found between {current_start} and {current_end}")
-                            break
-                            
-                        except requests.ConnectionError as e:
-                            if attempt == max_retries - 1:
-                                logger.error(f"Failed after {max_retries} attempts: {str(e)}")
-                                raise
-                            wait_time = 2 ** attempt
-                            logger.warning(f"Attempt {attempt + 1} failed, waiting {wait_time} seconds")
-                            time.sleep(wait_time)
-                    
-                    current_start = current_end
+            
+            # Fetch chunks concurrently; results come back in chunk order
+            with tqdm(total=len(chunks), desc="Fetching Load Data") as pbar, \
+                    ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = [
+                    pool.submit(self._fetch_load_chunk, chunk_start, chunk_end)
+                    for chunk_start, chunk_end in chunks
+                ]
+                for future in futures:
+                    chunk_data = future.result()
+                    if chunk_data is not None:
+                        all_data.append(chunk_data)
                     pbar.update(1)
             
             if not all_data:
@@ -104,16 +114,55 @@ class EntsoeClient:
                 return pd.DataFrame()
             
             # Combine all chunks
-            combined_data = pd.concat(all_data)
+            combined_data = pd.concat(all_data, copy=False)
             
-            # Save to CSV
-            filename = f'load_data_{start_date}_{end_date}.csv'
+            # Save to Parquet
+            filename = f'load_data_{start_date}_{end_date}'
             save_data(combined_data, filename)
+            write_cache(combined_data, cache_file)
             
             return combined_data
             
         except Exception as e:
-            logger.error(f"Error fetching load data: {str(e)}")
+            logger.error("Error fetching load data: %s", e)
+            raise
+    
+    def _fetch_load_chunk(
+        self,
+        current_start: pd.Timestamp,
+        current_end: pd.Timestamp
+    ) -> Optional[pd.DataFrame]:
+        """
+        Fetch a single chunk of load data
+        
+        Transient HTTP failures are retried by the session; a connection
+        error surfacing here means all retries were exhausted.
+        
+        Args:
+            current_start (pd.Timestamp): Chunk start
+            current_end (pd.Timestamp): Chunk end
+        
+        Returns:
+            Optional[pd.DataFrame]: Load data, or None if nothing was returned
+        """
+        try:
+            logger.info("Fetching data from %s to %s", current_start, current_end)
+            chunk_data = self.client.query_load_and_forecast(
+                country_code=self.country_code,
+                start=current_start,
+                end=current_end
+            )
+            
+            if chunk_data.empty:
+                return None
+            return chunk_data
+            
+        except NoMatchingDataError:
+            logger.warning("No data found between %s and %s", current_start, current_end)
+            return None
+            
+        except requests.ConnectionError as e:
+            logger.error("Failed to fetch data from %s to %s: %s", current_start, current_end, e)
             raise
     
     def get_latest_load(self) -> pd.DataFrame:
@@ -127,14 +176,167 @@ class EntsoeClient:
             end = datetime.now(self.tz)
             start = end - timedelta(days=1)
             
-            data = self.client.query_load_and_forecast(
+            return self.client.query_load_and_forecast(
                 country_code=self.country_code,
                 start=pd.Timestamp(start),
                 end=pd.Timestamp(end)
             )
             
-            return data
+        except Exception as e:
+            logger.error("Error fetching latest load data: %s", e)
+            raise
+    
+    def get_load_data(
+        self,
+        hours_back: int = 48,
+        forecast_hours: int = 24
+    ) -> Tuple[pd.Series, pd.Series]:
+        """
+        Fetch recent actual load together with the upcoming day-ahead forecast
+        
+        Args:
+            hours_back (int): Hours of actual load before now
+            forecast_hours (int): Hours of forecast load after now
+            
+        Returns:
+            Tuple[pd.Series, pd.Series]: Actual load and forecast load
+        """
+        try:
+            now = pd.Timestamp.now(tz=self.tz)
+            
+            data = self.client.query_load_and_forecast(
+                country_code=self.country_code,
+                start=now - pd.Timedelta(hours=hours_back),
+                end=now + pd.Timedelta(hours=forecast_hours)
+            )
+            
+            actual_load = data['Actual Load'].dropna()
+            forecast_load = data['Forecasted Load'].dropna()
+            
+            return actual_load, forecast_load
             
         except Exception as e:
-            logger.error(f"Error fetching latest load data: {str(e)}")
-            raise
\ No newline at end of file
+            logger.error("Error fetching load data: %s", e)
+            raise
+    
+    async def get_latest_load_async(self, http: httpx.AsyncClient) -> pd.DataFrame:
+        """
+        Fetch the most recent load data (last 24 hours) without blocking the event loop
+        
+        Results are cached for 5 minutes per country. Concurrent misses share
+        one upstream fetch; if it fails, every waiter sees the error and the
+        next call fetches again.
+        
+        Args:
+            http (httpx.AsyncClient): Long-lived async HTTP client, reused across calls
+            
+        Returns:
+            pd.DataFrame: Latest load data
+            
+        Raises:
+            NoMatchingDataError: If ENTSO-E has no data for the period
+        """
+        key = self.country_code
+        if key in _latest_cache:
+            return _latest_cache[key]
+        
+        task = _latest_inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_latest_load_async(http))
+            _latest_inflight[key] = task
+            
+            def _finish(done: asyncio.Task) -> None:
+                del _latest_inflight[key]
+                if not done.cancelled() and done.exception() is None:
+                    _latest_cache[key] = done.result()
+            
+            task.add_done_callback(_finish)
+        
+        # Shielded so one cancelled request does not cancel the fetch for the others
+        return await asyncio.shield(task)
+    
+    async def _fetch_latest_load_async(self, http: httpx.AsyncClient) -> pd.DataFrame:
+        """
+        Fetch the last 24 hours of load data from ENTSO-E
+        
+        Actual and day-ahead forecast load are requested concurrently over the
+        caller's pooled httpx.AsyncClient and combined the same way as
+        EntsoePandasClient.query_load_and_forecast.
+        
+        Args:
+            http (httpx.AsyncClient): Long-lived async HTTP client, reused across calls
+            
+        Returns:
+            pd.DataFrame: Latest load data
+            
+        Raises:
+            NoMatchingDataError: If ENTSO-E has no data for the period
+        """
+        try:
+            end = pd.Timestamp(datetime.now(self.tz))
+            start = end - timedelta(days=1)
+            area = lookup_area(self.country_code)
+            
+            base_params = {
+                'securityToken': self.client.api_key,
+                'documentType': 'A65',
+                'outBiddingZone_Domain': area.code,
+                'out_Domain': area.code,
+                'periodStart': start.tz_convert('UTC').strftime('%Y%m%d%H00'),
+                'periodEnd': end.tz_convert('UTC').strftime('%Y%m%d%H00')
+            }
+            
+            actual_resp, forecast_resp = await asyncio.gather(
+                self._get_with_retry(http, {**base_params, 'processType': 'A16'}),
+                self._get_with_retry(http, {**base_params, 'processType': 'A01'})
+            )
+            
+            df_forecast = parse_loads(forecast_resp.text, process_type='A01')
+            df_actual = parse_loads(actual_resp.text, process_type='A16')
+            data = df_forecast.join(df_actual, sort=True, how='outer')
+            
+            return data.tz_convert(self.tz).truncate(before=start, after=end)
+            
+        except Exception as e:
+            logger.error("Error fetching latest load data: %s", e)
+            raise
+    
+    async def _get_with_retry(self, http: httpx.AsyncClient, params: Dict) -> httpx.Response:
+        """
+        GET from the ENTSO-E API, retrying transient failures with jittered backoff
+        
+        Waiting uses asyncio.sleep so the event loop keeps serving other requests.
+        
+        Args:
+            http (httpx.AsyncClient): Shared async HTTP client
+            params (Dict): Query parameters
+            
+        Returns:
+            httpx.Response: Successful response
+            
+        Raises:
+            NoMatchingDataError: If ENTSO-E has no data for the query
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await http.get(ENTSOE_URL, params=params)
+                # ENTSO-E reports an empty period as an acknowledgement document,
+                # which entsoe-py turns into NoMatchingDataError
+                if 'No matching data found' in response.text:
+                    raise NoMatchingDataError
+                if response.status_code not in (429, 500, 502, 503, 504):
+                    response.raise_for_status()
+                    return response
+                error = httpx.HTTPStatusError(
+                    f"Server error {response.status_code}",
+                    request=response.request,
+                    response=response
+                )
+            except httpx.TransportError as e:
+                error = e
+            
+            if attempt == self.max_retries:
+                raise error
+            wait_time = backoff_delay(attempt)
+            logger.warning("Attempt %s failed, waiting %.1f seconds", attempt + 1, wait_time)
+            await asyncio.sleep(wait_time)
@@ -1,9 +1,8 @@
 from enum import Enum
 from typing import List, Optional, Dict
 import pandas as pd
-import pytz
 from datetime import datetime, timedelta
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
 import logging
 from pathlib import Path
@@ -11,11 +10,13 @@ from entsoe import EntsoePandasClient
 from entsoe.exceptions import NoMatchingDataError
 from tqdm import tqdm
 
-from src.config import ENTSOE_API_KEY, COUNTRY_CODE, RAW_DATA_PATH
-from src.data.utils import save_data
+from src.config import ENTSOE_API_KEY, COUNTRY_CODE, RAW_DATA_PATH, TZ
+from src.data.utils import save_data, create_session, split_date_range, get_cache_path, read_cache, write_cache
 
 logger = logging.getLogger(__name__)
 
+RENEWABLE_CACHE_TTL = 24 * 3600  # seconds
+
 class RenewableType(Enum):
     """Enum for renewable energy types and their ENTSO-E codes"""
     SOLAR = "B16"
@@ -28,11 +29,19 @@ class RenewableType(Enum):
 class RenewableClient:
     """Client for fetching renewable generation data from ENTSO-E"""
     
-    def __init__(self, api_key: str = ENTSOE_API_KEY, country_code: str = COUNTRY_CODE):
-        """Initialize ENTSO-E client for renewable data"""
-        self.client = EntsoePandasClient(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str = ENTSOE_API_KEY,
+        country_code: str = COUNTRY_CODE,
+        max_retries: int = 5
+    ):
+        """Initialize ENTSO-E client for renewable data with a pooled retrying session"""
+        self.session = create_session(max_retries=max_retries)
+        # The session's Retry is the only retry layer; entsoe-py's own @retry would
+        # repeat each attempt with fixed 10 s sleeps on top of it
+        self.client = EntsoePandasClient(api_key=api_key, session=self.session, retry_count=1)
         self.country_code = country_code
-        self.tz = pytz.timezone('Europe/Berlin')
+        self.tz = TZ
     
     def fetch_renewable_data(
         self,
@@ -40,7 +49,7 @@ class RenewableClient:
         end_date: str,
         renewable_types: Optional[List[RenewableType]] = None,
         chunk_size: int = 30,
-        max_retries: int = 5
+        cache_ttl: Optional[float] = RENEWABLE_CACHE_TTL
     ) -> pd.DataFrame:
         """Fetch renewable data with improved error handling"""
         try:
@@ -51,90 +60,70 @@ class RenewableClient:
             start_date = start_date.strip()
             end_date = end_date.strip()
             
-            start = self.tz.localize(datetime.strptime(start_date, '%Y%m%d'))
-            end = self.tz.localize(datetime.strptime(end_date, '%Y%m%d'))
+            start = datetime.strptime(start_date, '%Y%m%d').replace(tzinfo=self.tz)
+            end = datetime.strptime(end_date, '%Y%m%d').replace(tzinfo=self.tz)
             
-            # Calculate total operations
-            total_days = (end - start).days
-            num_chunks = (total_days + chunk_size - 1) // chunk_size
-            total_operations = num_chunks * len(renewable_types)
-            
-            all_data = {}
-            current_start = start
-            
-            with tqdm(total=total_operations, desc="Fetching Renewable Data") as pbar:
-                while current_start < end:
-                    current_end = min(current_start + timedelta(days=chunk_size), end)
-                    
-                    for r_type in renewable_types:
-                        if r_type.name.lower() not in all_data:
-                            all_data[r_type.name.lower()] = []
-                        
-                        success = False
-                        for attempt in range(max_retries):
-                            try:
-                                logger.info(f"Fetching {r_type.name} data from {current_start} to {current_end}")
-                                chunk_data = self.client.query_generation(
-                                    country_code=self.country_code,
-                                    start=pd.Timestamp(current_start),
-                                    end=pd.Timestamp(current_end),
-                                    psr_type=r_type.value
-                                )
-                                
-                                if not isinstance(chunk_data, pd.DataFrame):
-                                    raise ValueError(f"Invalid data received for {r_type.name}")
-                                
-                                if not chunk_data.empty:
-                                    all_data[r_type.name.lower()].append(chunk_data)
-                                    success = True
-                                    break
-                                else:
-                                    logger.warning(f"Empty data received for {r_type.name}")
-                                    
-                            except requests.exceptions.RequestException as e:
-                                wait_time = min(2 ** attempt, 60)  # Cap wait time at 60 seconds
-                                logger.warning(f"Request failed for {r_type.name}, attempt {attempt + 1}/{max_retries}. Error: {str(e)}")
-                                logger.warning(f"Waiting {wait_time} seconds before retry...")
-                                time.sleep(wait_time)
-                                
-                            except Exception as e:
-                                logger.error(f"Error fetching {r_type.name}: {str(e)}")
-                                break
-                        
-                        if not success:
-                            logger.error(f"Failed to fetch data for {r_type.name} after {max_retries} attempts")
-                        
+            # Serve repeated requests from the parquet cache
+            cache_file = get_cache_path(
+                'renewable', self.country_code, start_date, end_date,
+                *sorted(r_type.value for r_type in renewable_types)
+            )
+            cached = read_cache(cache_file, ttl=cache_ttl)
+            if cached is not None:
+                return cached
+            
+            # Split the period into chunks and calculate total operations
+            chunks = split_date_range(start, end, chunk_size)
+            total_operations = len(chunks) * len(renewable_types)
+            
+            all_data = {r_type.name.lower(): [] for r_type in renewable_types}
+            
+            with tqdm(total=total_operations, desc="Fetching Renewable Data") as pbar, \
+                    ThreadPoolExecutor(max_workers=len(renewable_types)) as pool:
+                for current_start, current_end in chunks:
+                    # Fetch all renewable types for this chunk concurrently
+                    futures = {
+                        pool.submit(self._fetch_renewable_chunk, r_type,
+                                    current_start, current_end): r_type
+                        for r_type in renewable_types
+                    }
+                    for future in as_completed(futures):
+                        r_type = futures[future]
+                        chunk_data = future.result()
+                        if chunk_data is not None:
+                            all_data[r_type.name.lower()].append(chunk_data)
                         pbar.update(1)
-                    
-                    current_start = current_end
             
             # Process successful data
-            combined_df = pd.DataFrame()
+            series_map: Dict[str, pd.Series] = {}
             for r_type, data_list in all_data.items():
                 if data_list:
                     try:
-                        df = pd.concat(data_list)
+                        df = pd.concat(data_list, copy=False)
                         
                         # Handle different data formats based on renewable type
                         if r_type.lower() == 'wind_offshore':
                             # Wind Offshore has a simple column name
                             if 'Wind Offshore' in df.columns:
-                                combined_df[f'{r_type}_generation'] = df['Wind Offshore']
-                                logger.info(f"Successfully processed {r_type} data")
+                                series_map[f'{r_type}_generation'] = df['Wind Offshore']
+                                logger.info("Successfully processed %s data", r_type)
                         else:
                             # Solar and Wind Onshore have MultiIndex columns
                             if isinstance(df.columns, pd.MultiIndex):
                                 type_name = r_type.replace('_', ' ').title()
                                 if (type_name, 'Actual Aggregated') in df.columns:
-                                    combined_df[f'{r_type}_generation'] = df[(type_name, 'Actual Aggregated')]
-                                    logger.info(f"Successfully processed {r_type} data")
+                                    series_map[f'{r_type}_generation'] = df[(type_name, 'Actual Aggregated')]
+                                    logger.info("Successfully processed %s data", r_type)
                             else:
-                                logger.warning(f"Unexpected column format for {r_type}: {df.columns}")
+                                logger.warning("Unexpected column format for %s: %s", r_type, df.columns)
                     
                     except Exception as e:
-                        logger.error(f"Error processing {r_type} data: {str(e)}")
-                        logger.error(f"Data type: {type(df)}")
-                        logger.error(f"Columns: {df.columns}")
+                        logger.error("Error processing %s data: %s", r_type, e)
+                        logger.error("Data type: %s", type(df))
+                        logger.error("Columns: %s", df.columns)
+            
+            # Build the frame in one step instead of assigning column by column
+            combined_df = pd.DataFrame(series_map)
             
             if combined_df.empty:
                 logger.error("No renewable data was successfully fetched")
@@ -147,16 +136,61 @@ class RenewableClient:
             # Sort the index to ensure chronological order
             combined_df = combined_df.sort_index()
             
-            # Save to CSV
-            filename = f'renewable_generation_{start_date}_{end_date}.csv'
+            # Save to Parquet
+            filename = f'renewable_generation_{start_date}_{end_date}'
             save_data(combined_df, filename)
+            write_cache(combined_df, cache_file)
             
             return combined_df
             
         except Exception as e:
-            logger.error(f"Error in renewable data collection: {str(e)}")
+            logger.error("Error in renewable data collection: %s", e)
             raise
     
+    def _fetch_renewable_chunk(
+        self,
+        r_type: RenewableType,
+        current_start: pd.Timestamp,
+        current_end: pd.Timestamp
+    ) -> Optional[pd.DataFrame]:
+        """
+        Fetch a single chunk of generation data for one renewable type
+        
+        Transient HTTP failures are retried by the session.
+        
+        Args:
+            r_type (RenewableType): Renewable type to fetch
+            current_start (pd.Timestamp): Chunk start
+            current_end (pd.Timestamp): Chunk end
+            
+        Returns:
+            Optional[pd.DataFrame]: Generation data, or None if the fetch failed
+        """
+        try:
+            logger.info("Fetching %s data from %s to %s", r_type.name, current_start, current_end)
+            chunk_data = self.client.query_generation(
+                country_code=self.country_code,
+                start=current_start,
+                end=current_end,
+                psr_type=r_type.value
+            )
+            
+            if not isinstance(chunk_data, pd.DataFrame):
+                raise ValueError(f"Invalid data received for {r_type.name}")
+            
+            if chunk_data.empty:
+                logger.warning("Empty data received for %s", r_type.name)
+                return None
+            return chunk_data
+            
+        except requests.exceptions.RequestException as e:
+            logger.error("Failed to fetch data for %s after retries: %s", r_type.name, e)
+            return None
+            
+        except Exception as e:
+            logger.error("Error fetching %s: %s", r_type.name, e)
+            return None
+    
     def get_latest_renewable_data(
         self,
         renewable_types: Optional[List[RenewableType]] = None
@@ -182,9 +216,10 @@ class RenewableClient:
                 start_date=start_date,
                 end_date=end_date,
                 renewable_types=renewable_types,
-                chunk_size=1
+                chunk_size=1,
+                cache_ttl=300  # Recent data changes, keep it fresh
             )
             
         except Exception as e:
-            logger.error(f"Error fetching latest renewable data: {str(e)}")
+            logger.error("Error fetching latest renewable data: %s", e)
             raise
\ No newline at end of file
@@ -1,18 +1,26 @@
 from enum import Enum
 from typing import List, Optional
 import pandas as pd
-from datetime import datetime, timedelta
+import polars as pl
+from datetime import datetime
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tqdm import tqdm
 from wetterdienst.provider.dwd.observation import DwdObservationRequest
 
-from src.config import RAW_DATA_PATH
-from src.data.utils import save_data
+from src.config import RAW_DATA_PATH, TIMEZONE
+from src.data.utils import save_data, split_date_range, backoff_delay
 
 logger = logging.getLogger(__name__)
 
+FALLBACK_CHUNK_SIZE = 30  # days per request when a long window fails
+
+# The hourly temperature_air dataset also carries relative humidity; only
+# the air temperature parameter is kept
+TEMPERATURE_PARAMETER_PREFIX = "temperature_air"
+
 class WeatherStation(Enum):
     """Enum for major German weather stations"""
     BERLIN = "00433"     # Berlin-Tempelhof (Northeast)
@@ -22,16 +30,23 @@ class WeatherStation(Enum):
 class WeatherClient:
     """Client for fetching weather data from DWD"""
     
+    __slots__ = ('stations', 'column_names')
+    
     def __init__(self):
-        """Initialize weather client with station IDs"""
+        """Initialize weather client with station IDs and their output column names"""
         self.stations = [station.value for station in WeatherStation]
+        self.column_names = {
+            station.value: f"temperature_{station.name.lower()}"
+            for station in WeatherStation
+        }
     
     def fetch_temperature_data(
         self,
         start_date: str,
         end_date: str,
         max_retries: int = 3,
-        chunk_size: int = 30
+        chunk_size: int = 365,
+        max_workers: int = 4
     ) -> pd.DataFrame:
         """
         Fetch hourly temperature data from DWD for major German cities
@@ -40,7 +55,9 @@ class WeatherClient:
             start_date (str): Start date in format YYYYMMDD
             end_date (str): End date in format YYYYMMDD
             max_retries (int): Maximum number of retry attempts
-            chunk_size (int): Number of days per request
+            chunk_size (int): Number of days per request; each request covers all
+                stations, so long windows keep the number of round trips low
+            max_workers (int): Number of chunks fetched concurrently
             
         Returns:
             pd.DataFrame: Hourly temperature data for all stations
@@ -62,90 +79,135 @@ class WeatherClient:
             if end <= start:
                 raise ValueError("End date must be after start date")
             
-            # Calculate number of chunks
-            total_days = (end - start).days
-            num_chunks = (total_days + chunk_size - 1) // chunk_size
+            # Split the period into chunks
+            chunks = split_date_range(start, end, chunk_size)
             
             all_data = []
-            current_start = start
             
-            with tqdm(total=num_chunks * len(self.stations), 
-                     desc="Fetching Weather Data") as pbar:
-                
-                while current_start < end:
-                    current_end = min(current_start + timedelta(days=chunk_size), end)
-                    chunk_start = current_start.strftime('%Y%m%d')
-                    chunk_end = current_end.strftime('%Y%m%d')
-                    
-                    for attempt in range(max_retries):
-                        try:
-                            # Create request for hourly temperature data
-                            request = DwdObservationRequest(
-                                parameter="temperature_air",
-                                resolution="hourly",
-                                start_date=chunk_start,
-                                end_date=chunk_end
-                            )
-                            
-                            # Get values for selected stations and convert to pandas
-                            values = request.filter_by_station_id(
-                                self.stations
-                            ).values.all().df
-                            
-                            if len(values) > 0:
-                                # Convert Polars DataFrame to Pandas DataFrame
-                                pandas_df = values.to_pandas()
-                                all_data.append(pandas_df)
-                                pbar.update(len(self.stations))
-                                break
-                                
-                        except Exception as e:
-                            if attempt == max_retries - 1:
-                                logger.error(f"Failed chunk {chunk_start}-{chunk_end}: {str(e)}")
-                                pbar.update(len(self.stations))
-                            else:
-                                wait_time = 2 ** attempt
-                                logger.warning(f"Attempt {attempt + 1} failed, waiting {wait_time}s")
-                                time.sleep(wait_time)
-                    
-                    current_start = current_end
+            # Fetch chunks concurrently; results come back in chunk order
+            with tqdm(total=len(chunks), desc="Fetching Weather Data",
+                     mininterval=0.5, smoothing=0) as pbar, \
+                    ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = [
+                    pool.submit(self._fetch_temperature_chunk, chunk_start, chunk_end, max_retries)
+                    for chunk_start, chunk_end in chunks
+                ]
+                for (chunk_start, chunk_end), future in zip(chunks, futures):
+                    chunk_data = future.result()
+                    if chunk_data is not None:
+                        all_data.append(chunk_data)
+                    elif (chunk_end - chunk_start).days > FALLBACK_CHUNK_SIZE:
+                        # Retry a failed long window as shorter requests
+                        logger.warning("Retrying %s to %s in %s-day chunks",
+                                       chunk_start, chunk_end, FALLBACK_CHUNK_SIZE)
+                        sub_chunks = split_date_range(chunk_start, chunk_end, FALLBACK_CHUNK_SIZE)
+                        for sub_data in pool.map(
+                            lambda bounds: self._fetch_temperature_chunk(*bounds, max_retries),
+                            sub_chunks
+                        ):
+                            if sub_data is not None:
+                                all_data.append(sub_data)
+                    pbar.update(1)
             
             if not all_data:
                 logger.error("No weather data was successfully fetched")
                 return pd.DataFrame()
             
-            # Combine all chunks
-            combined_df = pd.concat(all_data, ignore_index=True)
+            # Combine all chunks and pivot to one column per station in Polars
+            combined_df = pl.concat(all_data, rechunk=True)
             
-            # Process combined data
-            df_pivoted = combined_df.pivot_table(
-                index='date',
-                columns='station_id',
-                values='value',
-                aggfunc='mean'
+            # DWD timestamps are UTC; convert the long date column once, before pivoting
+            combined_df = combined_df.with_columns(
+                pl.col('date').dt.replace_time_zone('UTC').dt.convert_time_zone(TIMEZONE)
             )
             
-            # Rename columns to city names
-            df_pivoted.columns = [
-                f"temperature_{station.name.lower()}"
-                for station in WeatherStation
-            ]
+            # Chunks hold only the temperature parameter, so there is at most one observation
+            # per date and station; rows repeated at chunk boundaries are dropped with a
+            # hash pass first and the pivot needs no aggregation
+            combined_df = combined_df.unique(subset=['date', 'station_id'], keep='last')
+            wide_df = combined_df.pivot(
+                on='station_id',
+                index='date',
+                values='value'
+            ).sort('date')
             
-            # Convert temperature from Kelvin to Celsius
-            for col in df_pivoted.columns:
-                df_pivoted[col] = df_pivoted[col] - 273.15
-                logger.info(f"Converted {col} from Kelvin to Celsius")
+            # Rename columns to city names, keeping station order
+            station_names = {
+                station_id: name
+                for station_id, name in self.column_names.items()
+                if station_id in wide_df.columns
+            }
+            wide_df = wide_df.select(['date', *station_names]).rename(station_names)
+            
+            # Convert temperature from Kelvin to Celsius in one pass over all columns
+            wide_df = wide_df.with_columns(pl.exclude('date') - 273.15)
+            logger.info("Converted %s columns from Kelvin to Celsius", len(station_names))
+            
+            # Convert to pandas only once, at the end
+            df_pivoted = wide_df.to_pandas().set_index('date')
             
             # Save processed data
-            filename = f'weather_temperature_{start_date}_{end_date}.csv'
+            filename = f'weather_temperature_{start_date}_{end_date}'
             save_data(df_pivoted, filename)
             
             return df_pivoted
             
         except Exception as e:
-            logger.error(f"Error fetching weather data: {str(e)}")
+            logger.error("Error fetching weather data: %s", e)
             raise
     
+    def _fetch_temperature_chunk(
+        self,
+        current_start: pd.Timestamp,
+        current_end: pd.Timestamp,
+        max_retries: int = 3
+    ) -> Optional[pl.DataFrame]:
+        """
+        Fetch a single chunk of hourly temperature data for all stations
+        
+        Args:
+            current_start (pd.Timestamp): Chunk start
+            current_end (pd.Timestamp): Chunk end
+            max_retries (int): Maximum number of retry attempts
+            
+        Returns:
+            Optional[pl.DataFrame]: Temperature observations in long format, or None if the fetch failed
+        """
+        chunk_start = current_start.strftime('%Y%m%d')
+        chunk_end = current_end.strftime('%Y%m%d')
+        
+        for attempt in range(max_retries):
+            try:
+                # Create request for hourly temperature data
+                request = DwdObservationRequest(
+                    parameter="temperature_air",
+                    resolution="hourly",
+                    start_date=chunk_start,
+                    end_date=chunk_end
+                )
+                
+                # Get temperature values for selected stations, kept as Polars
+                values = request.filter_by_station_id(
+                    self.stations
+                ).values.all().df.filter(
+                    pl.col('parameter').str.starts_with(TEMPERATURE_PARAMETER_PREFIX)
+                )
+                
+                if len(values) == 0:
+                    logger.warning("No weather data found between %s and %s", chunk_start, chunk_end)
+                    return None
+                return values
+                
+            except Exception as e:
+                if attempt == max_retries - 1:
+                    logger.error("Failed chunk %s-%s: %s", chunk_start, chunk_end, e)
+                else:
+                    wait_time = backoff_delay(attempt)
+                    logger.warning("Attempt %s failed, waiting %.1fs", attempt + 1, wait_time)
+                    time.sleep(wait_time)
+        
+        return None
+    
     def get_latest_temperature(self) -> pd.DataFrame:
         """
         Fetch the most recent temperature data (last 24 hours)
@@ -165,5 +227,5 @@ class WeatherClient:
             )
             
         except Exception as e:
-            logger.error(f"Error fetching latest temperature data: {str(e)}")
+            logger.error("Error fetching latest temperature data: %s", e)
             raise 
\ No newline at end of file
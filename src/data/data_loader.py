@@ -1,20 +1,28 @@
-from typing import Dict, Optional, List
+from typing import NamedTuple, Optional, List
 import pandas as pd
 import logging
 from datetime import datetime
-from pathlib import Path
 from tqdm import tqdm
 
 from src.data.clients.entsoe_client import EntsoeClient
 from src.data.clients.weather_client import WeatherClient
 from src.data.clients.renewable_client import RenewableClient, RenewableType
 from src.config import RAW_DATA_PATH
+from src.data.utils import read_data
 
 logger = logging.getLogger(__name__)
 
+class DataBundle(NamedTuple):
+    """Load, weather and renewable data for one period"""
+    load: pd.DataFrame
+    weather: pd.DataFrame
+    renewable: pd.DataFrame
+
 class DataLoader:
     """Combined data loader for all data sources"""
     
+    __slots__ = ('entsoe_client', 'weather_client', 'renewable_client')
+    
     def __init__(self):
         """Initialize all clients"""
         self.entsoe_client = EntsoeClient()
@@ -26,7 +34,7 @@ class DataLoader:
         start_date: str,
         end_date: str,
         renewable_types: Optional[List[RenewableType]] = None
-    ) -> Dict[str, pd.DataFrame]:
+    ) -> DataBundle:
         """
         Fetch all required data from all sources with progress bars
         
@@ -36,10 +44,10 @@ class DataLoader:
             renewable_types (List[RenewableType], optional): Specific renewable types to fetch
             
         Returns:
-            Dict[str, pd.DataFrame]: Dictionary containing all fetched data
+            DataBundle: All fetched data
         """
         try:
-            logger.info(f"Starting comprehensive data collection from {start_date} to {end_date}")
+            logger.info("Starting comprehensive data collection from %s to %s", start_date, end_date)
             
             # Create progress bar for overall process
             with tqdm(total=3, desc="Overall Progress") as pbar:
@@ -68,23 +76,20 @@ class DataLoader:
                 )
                 pbar.update(1)
             
-            # Standardize timezones to Europe/Berlin
-            weather_data.index = weather_data.index.tz_convert('Europe/Berlin')
-            
-            return {
-                'load': load_data,
-                'weather': weather_data,
-                'renewable': renewable_data
-            }
+            return DataBundle(
+                load=load_data,
+                weather=weather_data,
+                renewable=renewable_data
+            )
             
         except Exception as e:
-            logger.error(f"Error in comprehensive data collection: {str(e)}")
+            logger.error("Error in comprehensive data collection: %s", e)
             raise
     
     def fetch_latest_data(
         self,
         renewable_types: Optional[List[RenewableType]] = None
-    ) -> Dict[str, pd.DataFrame]:
+    ) -> DataBundle:
         """
         Fetch the most recent data from all sources (last 24 hours)
         
@@ -92,7 +97,7 @@ class DataLoader:
             renewable_types (List[RenewableType], optional): Specific renewable types to fetch
             
         Returns:
-            Dict[str, pd.DataFrame]: Dictionary containing latest data
+            DataBundle: Latest data
         """
         try:
             logger.info("Fetching latest data from all sources")
@@ -103,50 +108,57 @@ class DataLoader:
                 renewable_types=renewable_types
             )
             
-            return {
-                'load': latest_load,
-                'weather': latest_weather,
-                'renewable': latest_renewable
-            }
+            return DataBundle(
+                load=latest_load,
+                weather=latest_weather,
+                renewable=latest_renewable
+            )
             
         except Exception as e:
-            logger.error(f"Error fetching latest data: {str(e)}")
+            logger.error("Error fetching latest data: %s", e)
             raise
     
     def load_cached_data(
         self,
         start_date: str,
         end_date: str
-    ) -> Dict[str, pd.DataFrame]:
+    ) -> DataBundle:
         """
-        Load previously saved data from CSV files
+        Load previously saved data from Parquet, Feather or CSV files
         
         Args:
             start_date (str): Start date in format YYYYMMDD
             end_date (str): End date in format YYYYMMDD
             
         Returns:
-            Dict[str, pd.DataFrame]: Dictionary containing cached data
+            DataBundle: Cached data, empty frames where no file was found
         """
         try:
             data = {}
             
-            # Load each data type
-            for data_type in ['load', 'weather', 'renewable']:
-                filename = f"{data_type}_{'generation_' if data_type == 'renewable' else ''}{start_date}_{end_date}.csv"
-                filepath = Path(RAW_DATA_PATH) / filename
+            # File name stems as written by each client
+            stems = {
+                'load': f"load_data_{start_date}_{end_date}",
+                'weather': f"weather_temperature_{start_date}_{end_date}",
+                'renewable': f"renewable_generation_{start_date}_{end_date}"
+            }
+            
+            # Load each data type, preferring the Parquet file
+            for data_type, stem in stems.items():
+                candidates = [RAW_DATA_PATH / f"{stem}{ext}" for ext in ('.parquet', '.feather', '.csv')]
+                filepath = next((path for path in candidates if path.exists()), None)
                 
-                if filepath.exists():
-                    logger.info(f"Loading cached {data_type} data from {filepath}")
-                    data[data_type] = pd.read_csv(filepath, index_col=0, parse_dates=True)
+                if filepath is not None:
+                    logger.info("Loading cached %s data from %s", data_type, filepath)
+                    data[data_type] = read_data(filepath)
                 else:
-                    logger.warning(f"No cached {data_type} data found at {filepath}")
+                    logger.warning("No cached %s data found at %s", data_type, candidates[0].with_suffix(''))
                     data[data_type] = pd.DataFrame()
             
-            return data
+            return DataBundle(**data)
             
         except Exception as e:
-            logger.error(f"Error loading cached data: {str(e)}")
+            logger.error("Error loading cached data: %s", e)
             raise
 
 # Example usage
@@ -180,7 +192,7 @@ if __name__ == "__main__":
         )
         
         # Print summaries
-        for data_type, df in historical_data.items():
+        for data_type, df in historical_data._asdict().items():
             if not df.empty:
                 print(f"\n=== {data_type.title()} Data Summary ===")
                 print(f"Time range: {df.index.min()} to {df.index.max()}")
@@ -190,4 +202,4 @@ if __name__ == "__main__":
                 print(df.head())
                 
     except Exception as e:
-        logger.error(f"Error in main execution: {str(e)}")
\ No newline at end of file
+        logger.error("Error in main execution: %s", e)
\ No newline at end of file
@@ -2,6 +2,7 @@ import logging
 from pathlib import Path
 import pandas as pd
 import numpy as np
+import polars as pl
 
 # Setup logging
 logging.basicConfig(
@@ -16,6 +17,8 @@ logger = logging.getLogger(__name__)
 class DataProcessor:
     """Class responsible for processing and cleaning the raw data."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -34,18 +37,26 @@ class DataProcessor:
         """
         # Check index
         if not isinstance(df.index, pd.DatetimeIndex):
-            logger.error(f"Index must be DatetimeIndex, got {type(df.index)}")
+            logger.error("Index must be DatetimeIndex, got %s", type(df.index))
             raise ValueError
         
         # Handle duplicates
         if not df.index.is_unique:
-            logger.warning("Duplicate indices found. Aggregating with median...")
-            df = df.groupby(df.index).median()
+            duplicated = df.index.duplicated(keep='first')
+            # take() builds a new frame that is safe to sort in place, no extra copy needed
+            first, extra = df.take(np.flatnonzero(~duplicated)), df[duplicated]
+            if extra.equals(first.loc[extra.index]):
+                # Exact repeats only need dropping, no aggregation
+                logger.warning("Duplicate rows found. Keeping first occurrence...")
+                df = first
+            else:
+                logger.warning("Duplicate indices found. Aggregating with median...")
+                df = df.groupby(df.index).median()
             
         # Sort index
         if not df.index.is_monotonic_increasing:
             logger.warning("Index not monotonic. Sorting...")
-            df = df.sort_index()
+            df.sort_index(inplace=True)
 
         return df
 
@@ -59,13 +70,17 @@ class DataProcessor:
         Returns:
             pd.DataFrame: Dataframe with handled missing values
         """
+        # One pass over the values gives both the early exit and the stats
+        missing_counts = df.isna().to_numpy().sum(axis=0)
+        if not missing_counts.any():
+            return df
+
         # Log missing value stats
-        missing_stats = df.isnull().sum()
-        if missing_stats.any():
-            logger.info(f"Missing values per column:\n{missing_stats}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Missing values per column:\n%s", pd.Series(missing_counts, index=df.columns))
 
         # Forward fill limited to 1 hour gaps
-        df = df.fillna(method='ffill', limit=1)
+        df.ffill(limit=1, inplace=True)
         
         return df
 
@@ -73,6 +88,8 @@ class DataProcessor:
     def _remove_outliers(df: pd.DataFrame, columns: list, threshold: float = 3) -> pd.DataFrame:
         """Remove outliers using z-score method.
 
+        The dataframe is modified in place; no copy is made.
+
         Args:
             df (pd.DataFrame): Input dataframe
             columns (list): Columns to check for outliers
@@ -81,18 +98,67 @@ class DataProcessor:
         Returns:
             pd.DataFrame: Dataframe with outliers removed
         """
-        df_clean = df.copy()
-        
-        for col in columns:
-            if col in df.columns:
-                z_scores = np.abs((df[col] - df[col].mean()) / df[col].std())
-                mask = z_scores < threshold
-                df_clean.loc[~mask, col] = np.nan
-                removed = (~mask).sum()
-                if removed > 0:
-                    logger.warning(f"Removed {removed} outliers from {col}")
+        columns = [col for col in columns if col in df.columns]
+        if not columns:
+            return df
+
+        # Score every column in one pass over a single float matrix
+        values = df[columns].to_numpy(dtype=float)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.nanmean(values, axis=0)
+            std = np.nanstd(values, axis=0, ddof=1)
+            mask = np.abs((values - mean) / std) >= threshold
+
+        df[columns] = np.where(mask, np.nan, values)
+
+        for col, removed in zip(columns, mask.sum(axis=0)):
+            if removed > 0:
+                logger.warning("Removed %s outliers from %s", removed, col)
+
+        return df
+
+    @staticmethod
+    def _process_lazy(lf: pl.LazyFrame, threshold: float = 3) -> pd.DataFrame:
+        """Run all cleaning steps as one Polars lazy query.
 
-        return df_clean
+        Duplicate timestamps are aggregated with the median, rows sorted,
+        single-hour gaps forward filled and z-score outliers set to null,
+        matching the pandas steps above.
+
+        Args:
+            lf (pl.LazyFrame): Input data with a 'timestamp' column
+            threshold (float): Z-score threshold
+
+        Returns:
+            pd.DataFrame: Cleaned dataframe indexed by timestamp
+        """
+        schema = lf.collect_schema()
+        numeric_columns = [
+            name for name, dtype in schema.items()
+            if name != 'timestamp' and dtype.is_numeric()
+        ]
+
+        def z_score(col):
+            return (pl.col(col) - pl.col(col).mean()).abs() / pl.col(col).std()
+
+        df = (
+            lf.group_by('timestamp')
+            .agg(pl.all().median())
+            .sort('timestamp')
+            .with_columns(pl.exclude('timestamp').fill_null(strategy='forward', limit=1))
+            .with_columns([
+                # A zero or undefined std gives a NaN or null score, which keeps the value
+                # as in pandas; Polars orders NaN above every number, so it is excluded
+                pl.when((z_score(col) >= threshold) & z_score(col).is_not_nan())
+                .then(None)
+                .otherwise(pl.col(col))
+                .alias(col)
+                for col in numeric_columns
+            ])
+            .collect()
+        )
+
+        return df.to_pandas().set_index('timestamp')
 
     def process_data(self, input_path: str, output_path: str) -> None:
         """Main method to process the data.
@@ -101,22 +167,29 @@ class DataProcessor:
             input_path (str): Path to input data file
             output_path (str): Path to save processed data
         """
-        logger.info(f"Processing data from {input_path}")
-
-        # Read data
-        df = pd.read_csv(input_path, parse_dates=['timestamp'], index_col='timestamp')
-
-        # Apply processing steps
-        df = self._enforce_data_quality(df)
-        df = self._handle_missing_values(df)
-        
-        # Remove outliers from numeric columns
-        numeric_columns = df.select_dtypes(include=[np.number]).columns
-        df = self._remove_outliers(df, columns=numeric_columns)
+        logger.info("Processing data from %s", input_path)
+
+        if Path(input_path).suffix == '.parquet':
+            # Parquet is scanned lazily and cleaned in a single Polars query
+            df = self._process_lazy(pl.scan_parquet(input_path))
+        else:
+            # Read data
+            df = pd.read_csv(input_path, parse_dates=['timestamp'], index_col='timestamp')
+
+            # Apply processing steps
+            df = self._enforce_data_quality(df)
+            df = self._handle_missing_values(df)
+            
+            # Remove outliers from numeric columns
+            numeric_columns = df.select_dtypes(include=[np.number]).columns
+            df = self._remove_outliers(df, columns=numeric_columns)
 
         # Ensure output directory exists
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
         # Save processed data
-        df.to_csv(output_path)
-        logger.info(f"Processed data saved to {output_path}")
\ No newline at end of file
+        if Path(output_path).suffix == '.parquet':
+            df.to_parquet(output_path, engine='pyarrow', compression='zstd')
+        else:
+            df.to_csv(output_path)
+        logger.info("Processed data saved to %s", output_path)
\ No newline at end of file
@@ -1,25 +1,195 @@
+import hashlib
+import random
+import time
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
+from typing import List, Optional, Tuple
 import logging
 
-from src.config import RAW_DATA_PATH
+from src.config import RAW_DATA_PATH, CACHE_DIR
 
 logger = logging.getLogger(__name__)
 
-def save_data(df: pd.DataFrame, filename: str) -> None:
+def save_data(df: pd.DataFrame, filename: str, format: str = 'parquet') -> Path:
     """
-    Save DataFrame to CSV file
+    Save DataFrame to a Parquet, Feather or CSV file
     
     Args:
         df (pd.DataFrame): DataFrame to save
-        filename (str): Name of the file
+        filename (str): Name of the file; the extension is set from the format
+        format (str): 'parquet', 'feather' or 'csv'
+            
+    Returns:
+        Path: Path of the written file
     """
     try:
-        Path(RAW_DATA_PATH).mkdir(parents=True, exist_ok=True)
-        filepath = Path(RAW_DATA_PATH) / filename
-        df.to_csv(filepath)
-        logger.info(f"Data saved to {filepath}")
+        if format not in ('parquet', 'feather', 'csv'):
+            raise ValueError(f"Unsupported format: {format}")
+        
+        filepath = (RAW_DATA_PATH / filename).with_suffix(f'.{format}')
+        
+        if format == 'parquet':
+            df.to_parquet(filepath, engine='pyarrow', compression='zstd')
+        elif format == 'feather':
+            # Arrow IPC stores the index as a regular column
+            df.reset_index().to_feather(filepath, compression='lz4')
+        else:
+            df.to_csv(filepath)
+        logger.info("Data saved to %s", filepath)
+        return filepath
+        
+    except Exception as e:
+        logger.error("Error saving data: %s", e)
+        raise
+
+def read_data(filepath: Path) -> pd.DataFrame:
+    """
+    Read a file written by save_data, based on its extension
+    
+    Args:
+        filepath (Path): Path to a .parquet, .feather or .csv file
+        
+    Returns:
+        pd.DataFrame: Loaded data with its index restored
+    """
+    filepath = Path(filepath)
+    if filepath.suffix == '.parquet':
+        return pd.read_parquet(filepath, engine='pyarrow')
+    if filepath.suffix == '.feather':
+        df = pd.read_feather(filepath)
+        df = df.set_index(df.columns[0])
+        if df.index.name == 'index':
+            df.index.name = None
+        return df
+    
+    # Arrow's multi-threaded CSV reader; timestamps with offsets come back as UTC
+    df = pd.read_csv(filepath, index_col=0, parse_dates=True, engine='pyarrow')
+    if isinstance(df.index, pd.DatetimeIndex):
+        df.index = df.index.as_unit('ns')
+    if df.index.name == '':
+        df.index.name = None
+    return df
+
+def split_date_range(
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+    chunk_size: int
+) -> List[Tuple[pd.Timestamp, pd.Timestamp]]:
+    """
+    Split a period into consecutive chunks of at most chunk_size days
+    
+    Args:
+        start (pd.Timestamp): Period start
+        end (pd.Timestamp): Period end
+        chunk_size (int): Number of days per chunk
+        
+    Returns:
+        List[Tuple[pd.Timestamp, pd.Timestamp]]: (chunk_start, chunk_end) pairs
+    """
+    if end <= start:
+        return []
+    
+    boundaries = pd.date_range(start, end, freq=pd.Timedelta(days=chunk_size))
+    if boundaries[-1] != end:
+        boundaries = boundaries.append(pd.DatetimeIndex([end]))
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+def backoff_delay(attempt: int, cap: float = 60) -> float:
+    """
+    Exponential backoff with jitter for retry loops
+    
+    The random factor spreads out retries from concurrent workers so they
+    do not hit the upstream API at the same moment.
+    
+    Args:
+        attempt (int): Zero-based retry attempt
+        cap (float): Upper bound of the base delay in seconds
+        
+    Returns:
+        float: Seconds to wait before the next attempt
+    """
+    return min(cap, 2 ** attempt) * (0.5 + random.random())
+
+def create_session(max_retries: int = 3) -> requests.Session:
+    """
+    Create a pooled HTTP session that retries transient failures
+    
+    Connections are kept alive across chunk requests so each chunk does not
+    pay a new TCP/TLS handshake. Connection errors and throttling/server
+    errors are retried with exponential backoff.
+    
+    Args:
+        max_retries (int): Maximum number of retry attempts
+        
+    Returns:
+        requests.Session: Configured session
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=0.5,
+        backoff_jitter=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['GET']
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def get_cache_path(prefix: str, *key_parts) -> Path:
+    """
+    Build a content-keyed parquet path in the cache directory
+    
+    Args:
+        prefix (str): File name prefix, e.g. the data type
+        *key_parts: Values identifying the request (country, dates, ...)
+        
+    Returns:
+        Path: Cache file path
+    """
+    key = hashlib.blake2b('|'.join(map(str, key_parts)).encode()).hexdigest()[:16]
+    return Path(CACHE_DIR) / f"{prefix}_{key}.parquet"
+
+def read_cache(path: Path, ttl: Optional[float] = None) -> Optional[pd.DataFrame]:
+    """
+    Read a cached DataFrame if it exists and is still fresh
+    
+    Args:
+        path (Path): Cache file path
+        ttl (float, optional): Maximum age in seconds, None for no expiry
+        
+    Returns:
+        Optional[pd.DataFrame]: Cached data, or None on a cache miss
+    """
+    try:
+        if not path.exists():
+            return None
+        if ttl is not None and time.time() - path.stat().st_mtime > ttl:
+            return None
+        
+        logger.info("Loading cached data from %s", path)
+        return pd.read_parquet(path)
+        
+    except Exception as e:
+        logger.warning("Ignoring unreadable cache file %s: %s", path, e)
+        return None
+
+def write_cache(df: pd.DataFrame, path: Path) -> None:
+    """
+    Write a DataFrame to the parquet cache
+    
+    Args:
+        df (pd.DataFrame): DataFrame to cache
+        path (Path): Cache file path
+    """
+    try:
+        df.to_parquet(path, compression='zstd')
+        logger.info("Data cached to %s", path)
         
     except Exception as e:
-        logger.error(f"Error saving data: {str(e)}")
-        raise 
\ No newline at end of file
+        logger.warning("Error caching data: %s", e)
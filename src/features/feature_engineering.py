@@ -6,6 +6,7 @@ from pathlib import Path
 # Third-party imports
 import numpy as np
 import pandas as pd
+import bottleneck as bn
 import holidays
 import lightgbm as lgb
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
@@ -15,6 +16,18 @@ from plotly.subplots import make_subplots
 # Suppress warnings
 warnings.filterwarnings('ignore', category=UserWarning)
 
+def _move(func, values, window, **kwargs):
+    """
+    Apply a bottleneck move_* function like pandas rolling(window, min_periods=1)
+    
+    bottleneck rejects windows longer than the array; with min_count=1 such a
+    window covers the whole prefix at every position, which is the same as a
+    window of len(values).
+    """
+    if len(values) == 0:
+        return values.copy()
+    return func(values, min(window, len(values)), min_count=1, **kwargs)
+
 class EnhancedFeatureExtractor24h:
     """Feature extractor for 24-hour load forecasting"""
     
@@ -24,6 +37,14 @@ class EnhancedFeatureExtractor24h:
         self.evening_peak_hours = [16, 17, 18]
         self.base_hours = [0, 1, 2, 3, 4, 22, 23]
         
+        # Cyclical encodings only take 24 and 7 distinct values; look them up instead
+        hour_angles = 2 * np.pi * np.arange(24) / 24
+        weekday_angles = 2 * np.pi * np.arange(7) / 7
+        self._hour_sin = np.sin(hour_angles).astype(np.float32)
+        self._hour_cos = np.cos(hour_angles).astype(np.float32)
+        self._weekday_sin = np.sin(weekday_angles).astype(np.float32)
+        self._weekday_cos = np.cos(weekday_angles).astype(np.float32)
+        
     def extract_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Extract features from input DataFrame
@@ -39,97 +60,117 @@ class EnhancedFeatureExtractor24h:
             DataFrame with extracted features
         """
         try:
-            df = df.copy()
-            
             # Input validation
             if not isinstance(df.index, pd.DatetimeIndex):
                 raise ValueError("DataFrame index must be DatetimeIndex")
             if 'load' not in df.columns:
                 raise ValueError("DataFrame must contain 'load' column")
             
+            # Calendar fields are read from the index once and shared by the helpers
+            hours = df.index.hour.to_numpy()
+            weekdays = df.index.weekday.to_numpy()
+            
+            # Helpers add arrays to this dict; the frame is assembled once at the end
+            features = {}
+            
             # Extract basic time features
-            df = self._add_time_features(df)
+            self._add_time_features(features, hours, weekdays)
             
             # Add rolling statistics
-            df = self._add_rolling_stats(df)
+            self._add_rolling_stats(df, features)
             
             # Add peak handling features
-            df = self._add_peak_features(df)
+            self._add_peak_features(df, features, hours)
             
             # Add renewable features if available
-            df = self._add_renewable_features(df)
+            self._add_renewable_features(df, features)
             
-            # Clean up temporary columns
-            df = self._cleanup_features(df)
+            # Features are computed in float64 for accuracy but stored as float32
+            features = {
+                name: values.astype(np.float32) if values.dtype == np.float64 else values
+                for name, values in features.items()
+            }
             
-            return df
+            # The input is only read, never modified, so it is joined here without a defensive copy
+            return pd.concat([df, pd.DataFrame(features, index=df.index, copy=False)], axis=1)
             
         except Exception as e:
             print(f"Error in feature extraction: {str(e)}")
             raise
             
-    def _add_time_features(self, df):
+    def _add_time_features(self, features, hours, weekdays):
         """Add basic time-based features"""
-        df['hour'] = df.index.hour
-        df['weekday'] = df.index.weekday
-        
         # Cyclical encoding
-        df['hour_sin'] = np.sin(2 * np.pi * df['hour'] / 24)
-        df['hour_cos'] = np.cos(2 * np.pi * df['hour'] / 24)
-        df['weekday_sin'] = np.sin(2 * np.pi * df['weekday'] / 7)
-        df['weekday_cos'] = np.cos(2 * np.pi * df['weekday'] / 7)
+        features['hour_sin'] = self._hour_sin[hours]
+        features['hour_cos'] = self._hour_cos[hours]
+        features['weekday_sin'] = self._weekday_sin[weekdays]
+        features['weekday_cos'] = self._weekday_cos[weekdays]
         
-        return df
-        
-    def _add_rolling_stats(self, df):
+    def _add_rolling_stats(self, df, features):
         """Add rolling statistics features"""
-        for window in self.windows:
-            df[f'load_{window}h_mean'] = df['load'].rolling(window=window, min_periods=1).mean()
-            df[f'load_{window}h_std'] = df['load'].rolling(window=window, min_periods=1).std()
-            df[f'load_{window}h_min'] = df['load'].rolling(window=window, min_periods=1).min()
-            df[f'load_{window}h_max'] = df['load'].rolling(window=window, min_periods=1).max()
+        # Streaming C kernels over the raw array; same results as pandas rolling(min_periods=1)
+        load = df['load'].to_numpy(dtype=np.float64)
         
-        return df
+        # Every window at least as long as the data is the same expanding window,
+        # so short inputs compute those statistics once and share them
+        stats = {}
+        for window in self.windows:
+            effective = min(window, len(load))
+            if effective not in stats:
+                stats[effective] = (
+                    _move(bn.move_mean, load, effective),
+                    _move(bn.move_std, load, effective, ddof=1),
+                    _move(bn.move_min, load, effective),
+                    _move(bn.move_max, load, effective)
+                )
+            mean, std, min_, max_ = stats[effective]
+            features[f'load_{window}h_mean'] = mean
+            features[f'load_{window}h_std'] = std
+            features[f'load_{window}h_min'] = min_
+            features[f'load_{window}h_max'] = max_
         
-    def _add_peak_features(self, df):
+    def _add_peak_features(self, df, features, hours):
         """Add peak-specific features"""
-        df['is_morning_peak'] = df.index.hour.isin(self.morning_peak_hours)
-        df['is_evening_peak'] = df.index.hour.isin(self.evening_peak_hours)
-        df['is_base_load'] = df.index.hour.isin(self.base_hours)
+        morning_mask = np.isin(hours, self.morning_peak_hours)
+        evening_mask = np.isin(hours, self.evening_peak_hours)
+        
+        features['is_morning_peak'] = morning_mask
+        features['is_evening_peak'] = evening_mask
+        features['is_base_load'] = np.isin(hours, self.base_hours)
+        
+        load = df['load'].to_numpy(dtype=np.float64)
         
         for window in [3, 6, 12]:
+            # Roll over the contiguous series once; peak columns keep the values at peak hours
+            window_mean = _move(bn.move_mean, load, window)
+            window_max = _move(bn.move_max, load, window)
+            
             # Morning peak features
-            morning_mask = df['is_morning_peak']
-            df[f'morning_peak_{window}h_mean'] = df[morning_mask]['load'].rolling(window, min_periods=1).mean()
-            df[f'morning_peak_{window}h_max'] = df[morning_mask]['load'].rolling(window, min_periods=1).max()
+            features[f'morning_peak_{window}h_mean'] = np.where(morning_mask, window_mean, np.nan)
+            features[f'morning_peak_{window}h_max'] = np.where(morning_mask, window_max, np.nan)
             
             # Evening peak features
-            evening_mask = df['is_evening_peak']
-            df[f'evening_peak_{window}h_mean'] = df[evening_mask]['load'].rolling(window, min_periods=1).mean()
-            df[f'evening_peak_{window}h_max'] = df[evening_mask]['load'].rolling(window, min_periods=1).max()
+            features[f'evening_peak_{window}h_mean'] = np.where(evening_mask, window_mean, np.nan)
+            features[f'evening_peak_{window}h_max'] = np.where(evening_mask, window_max, np.nan)
         
-        return df
-        
-    def _add_renewable_features(self, df):
+    def _add_renewable_features(self, df, features):
         """Add renewable energy features if available"""
+        hour_sin = features['hour_sin']
+        
         if 'solar_yesterday' in df.columns:
-            df['solar_hour_sin'] = df['solar_yesterday'] * df['hour_sin']
-            df['morning_solar_ramp'] = df['is_morning_peak'] * df['solar_yesterday']
-            df['evening_solar_ramp'] = df['is_evening_peak'] * df['solar_yesterday']
+            solar = df['solar_yesterday'].to_numpy(dtype=np.float64)
+            features['solar_hour_sin'] = solar * hour_sin
+            features['morning_solar_ramp'] = features['is_morning_peak'] * solar
+            features['evening_solar_ramp'] = features['is_evening_peak'] * solar
             
             for window in [24, 168]:
-                df[f'solar_{window}h_mean'] = df['solar_yesterday'].rolling(window, min_periods=1).mean()
+                features[f'solar_{window}h_mean'] = _move(bn.move_mean, solar, window)
         
         if all(col in df.columns for col in ['wind_offshore_yesterday', 'wind_onshore_yesterday']):
-            df['total_wind'] = df['wind_offshore_yesterday'] + df['wind_onshore_yesterday']
-            df['wind_hour_sin'] = df['total_wind'] * df['hour_sin']
+            wind = (df['wind_offshore_yesterday'].to_numpy(dtype=np.float64)
+                    + df['wind_onshore_yesterday'].to_numpy(dtype=np.float64))
+            features['total_wind'] = wind
+            features['wind_hour_sin'] = wind * hour_sin
             
             for window in [24, 168]:
-                df[f'wind_{window}h_mean'] = df['total_wind'].rolling(window, min_periods=1).mean()
-        
-        return df
-        
-    def _cleanup_features(self, df):
-        """Remove temporary columns"""
-        columns_to_drop = ['hour', 'weekday']
-        return df.drop(columns=[col for col in columns_to_drop if col in df.columns]) 
\ No newline at end of file
+                features[f'wind_{window}h_mean'] = _move(bn.move_mean, wind, window)
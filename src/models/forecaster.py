@@ -1,30 +1,79 @@
+import threading
+import numpy as np
 import pandas as pd
-from sklearn.ensemble import RandomForestRegressor
+import lightgbm as lgb
 from datetime import datetime, timedelta
 
 class EnergyForecaster:
     def __init__(self):
-        self.model = RandomForestRegressor(n_estimators=100, random_state=42)
+        self.model = lgb.LGBMRegressor(
+            n_estimators=200,
+            num_leaves=63,
+            learning_rate=0.05,
+            objective='regression',
+            n_jobs=-1,
+            random_state=42,
+            verbose=-1
+        )
+        # Fitted LightGBM booster; set by train() or load() and used for all predictions
+        self.booster = None
         self.is_trained = False
+        # Per-thread buffer reused by predict, so repeated forecasts do not allocate
+        # a new feature matrix and concurrent callers never share one
+        self._local = threading.local()
 
-    def prepare_features(self, df):
-        # Add time-based features
-        df['hour'] = df.index.hour
-        df['day_of_week'] = df.index.dayofweek
-        df['month'] = df.index.month
-        return df[['hour', 'day_of_week', 'month']]
+    def prepare_features(self, df, out=None):
+        """Build the hour, day-of-week and month feature matrix from the index without touching df"""
+        index = df.index
+        if out is None:
+            out = np.empty((len(index), 3), dtype=np.float32)
+        out[:, 0] = index.hour
+        out[:, 1] = index.dayofweek
+        out[:, 2] = index.month
+        return out
 
     def train(self, historical_load):
         """Train the model on historical load data"""
         X = self.prepare_features(historical_load)
         y = historical_load['load']
-        self.model.fit(X, y)
+        # Hour, day of week and month are small non-negative integers, split as categories
+        self.model.fit(X, y, categorical_feature=[0, 1, 2])
+        self.booster = self.model.booster_
         self.is_trained = True
 
     def predict(self, input_data):
-        """Generate predictions for the input data"""
+        """Generate predictions for the input data; safe to call from several threads"""
         if not self.is_trained:
             raise ValueError("Model needs to be trained before making predictions")
         
-        X = self.prepare_features(input_data)
-        return self.model.predict(X)
+        n = len(input_data)
+        buf = getattr(self._local, 'feat_buf', None)
+        if buf is None or n > len(buf):
+            buf = self._local.feat_buf = np.empty((max(n, 48), 3), dtype=np.float32)
+        X = self.prepare_features(input_data, out=buf[:n])
+        # Offline use; tree traversal is spread over all cores
+        return self.booster.predict(X)
+
+    def predict_batch(self, X):
+        """Generate predictions for an already prepared feature matrix"""
+        if not self.is_trained:
+            raise ValueError("Model needs to be trained before making predictions")
+        
+        # Serves the API's batched requests; each uvicorn worker predicts on a single
+        # thread so the workers do not oversubscribe the cores
+        return self.booster.predict(X, num_threads=1)
+
+    def save(self, path):
+        """Save the trained booster to disk in LightGBM's native text format"""
+        if not self.is_trained:
+            raise ValueError("Model needs to be trained before saving")
+        
+        self.booster.save_model(str(path))
+
+    @classmethod
+    def load(cls, path):
+        """Load a forecaster from a model saved with save(); fails on any other file"""
+        forecaster = cls()
+        forecaster.booster = lgb.Booster(model_file=str(path))
+        forecaster.is_trained = True
+        return forecaster
@@ -0,0 +1,44 @@
+"""
+Train the EnergyForecaster once and save it for the API to load at startup
+
+Usage:
+    python -m src.models.train --data data/raw/load_data_20230101_20240301.parquet
+"""
+import argparse
+import logging
+from pathlib import Path
+
+import pandas as pd
+
+from src.config import MODEL_PATH, TIMEZONE
+from src.data.utils import read_data
+from src.models.forecaster import EnergyForecaster
+
+logger = logging.getLogger(__name__)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train and save the load forecasting model")
+    parser.add_argument('--data', required=True,
+                        help="Load data file written by save_data (.parquet, .feather or .csv)")
+    parser.add_argument('--column', default='Actual Load',
+                        help="Column holding the load to forecast")
+    parser.add_argument('--out', default=str(MODEL_PATH),
+                        help="Where to write the trained model")
+    args = parser.parse_args(argv)
+
+    df = read_data(Path(args.data))
+    historical_load = df[[args.column]].rename(columns={args.column: 'load'}).dropna()
+    historical_load.index = pd.to_datetime(historical_load.index, utc=True).tz_convert(TIMEZONE)
+
+    logger.info("Training on %s rows from %s", len(historical_load), args.data)
+    forecaster = EnergyForecaster()
+    forecaster.train(historical_load)
+
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    forecaster.save(out)
+    logger.info("Model saved to %s", out)
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -1,13 +1,36 @@
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend; figures are only ever saved to file
 import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
 import numpy as np
 from typing import Tuple, Optional, Dict, List
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+# Plot method and output filename for each figure in create_analysis_report
+REPORT_PLOTS = {
+    'plot_time_series': 'time_series',
+    'plot_distribution': 'distribution',
+    'plot_scatter_comparison': 'scatter',
+    'plot_error_analysis': 'error_analysis',
+    'plot_daily_pattern': 'daily_pattern',
+    # 'plot_weekly_pattern': 'weekly_pattern',
+    'plot_error_heatmap': 'error_heatmap',
+    'plot_rolling_metrics': 'rolling_metrics'
+}
 
 class EnergyPlots:
   """Class containing all visualization methods for energy data analysis."""
   
+  # KDE cost grows with the sample count; a uniform subsample gives the same curve
+  KDE_MAX_POINTS = 2000
+  
+  # Saved figure resolution and PNG encoder options; fast zlib keeps saves cheap
+  DPI = 150
+  PNG_KW = {'compress_level': 1}
+  
   def __init__(self):
       # Set style for all plots
       plt.style.use('dark_background')
@@ -22,15 +45,40 @@ class EnergyPlots:
   def save_plot(self, fig: plt.Figure, filename: str, save_dir: str = 'reports/figures/'):
       """Save plot to specified directory."""
       Path(save_dir).mkdir(parents=True, exist_ok=True)
-      fig.savefig(Path(save_dir) / f"{filename}.png", dpi=300, bbox_inches='tight')
+      fig.savefig(Path(save_dir) / f"{filename}.png", dpi=self.DPI, bbox_inches='tight',
+                  pil_kwargs=self.PNG_KW)
       plt.close(fig)
 
+  def _align(self, actual: pd.Series, forecast: pd.Series) -> Tuple[pd.Series, pd.Series]:
+      """Restrict both series to their common timestamps."""
+      if actual.index.equals(forecast.index):
+          return actual, forecast
+      common_idx = actual.index.intersection(forecast.index)
+      return actual[common_idx], forecast[common_idx]
+
+  def _bucket_mean(self, series: pd.Series, keys: np.ndarray, n: int) -> np.ndarray:
+      """Mean of a series per integer key in [0, n), NaN where a bucket has no values."""
+      values = series.to_numpy(dtype=np.float64)
+      valid = ~np.isnan(values)
+      sums = np.bincount(keys[valid], weights=values[valid], minlength=n)
+      counts = np.bincount(keys[valid], minlength=n)
+      with np.errstate(divide='ignore', invalid='ignore'):
+          return sums / counts
+
+  def _kde_sample(self, series: pd.Series) -> pd.Series:
+      """Uniformly subsample a series to at most KDE_MAX_POINTS values."""
+      series = series.dropna()
+      if len(series) <= self.KDE_MAX_POINTS:
+          return series
+      return series.sample(n=self.KDE_MAX_POINTS, random_state=0)
+
   def plot_time_series(self, 
                       actual: pd.Series, 
                       forecast: pd.Series,
                       title: str = 'Energy Load Time Series',
                       save: bool = False,
-                      filename: str = 'time_series') -> plt.Figure:
+                      filename: str = 'time_series',
+                      save_dir: str = 'reports/figures/') -> plt.Figure:
       """Plot time series of actual and forecasted loads."""
       fig, ax = plt.subplots(figsize=self.default_figsize)
       
@@ -48,7 +96,7 @@ class EnergyPlots:
       ax.grid(True, alpha=0.2)
       
       if save:
-          self.save_plot(fig, filename)
+          self.save_plot(fig, filename, save_dir)
       
       return fig
 
@@ -56,13 +104,14 @@ class EnergyPlots:
                         actual: pd.Series,
                         forecast: pd.Series,
                         save: bool = False,
-                        filename: str = 'distribution') -> plt.Figure:
+                        filename: str = 'distribution',
+                        save_dir: str = 'reports/figures/') -> plt.Figure:
       """Plot distribution of actual and forecasted loads."""
       fig, ax = plt.subplots(figsize=self.default_figsize)
       
-      sns.kdeplot(data=actual, label='Actual Load', 
+      sns.kdeplot(data=self._kde_sample(actual), label='Actual Load', 
                   color=self.colors['actual'], ax=ax)
-      sns.kdeplot(data=forecast, label='Forecast Load', 
+      sns.kdeplot(data=self._kde_sample(forecast), label='Forecast Load', 
                   color=self.colors['forecast'], ax=ax)
       
       ax.set_title('Load Distribution')
@@ -72,7 +121,7 @@ class EnergyPlots:
       ax.grid(True, alpha=0.2)
       
       if save:
-          self.save_plot(fig, filename)
+          self.save_plot(fig, filename, save_dir)
       
       return fig
 
@@ -80,21 +129,19 @@ class EnergyPlots:
                             actual: pd.Series,
                             forecast: pd.Series,
                             save: bool = False,
-                            filename: str = 'scatter') -> plt.Figure:
+                            filename: str = 'scatter',
+                            save_dir: str = 'reports/figures/') -> plt.Figure:
       """Create scatter plot of actual vs forecast values."""
-      # Align the data on common timestamps
-      common_idx = actual.index.intersection(forecast.index)
-      actual_aligned = actual[common_idx]
-      forecast_aligned = forecast[common_idx]
+      actual, forecast = self._align(actual, forecast)
       
       fig, ax = plt.subplots(figsize=self.default_figsize)
       
-      ax.scatter(actual_aligned, forecast_aligned, alpha=0.5, 
+      ax.scatter(actual, forecast, alpha=0.5, 
                 color=self.colors['actual'], label='Load Points')
       
       # Perfect prediction line
-      min_val = min(actual_aligned.min(), forecast_aligned.min())
-      max_val = max(actual_aligned.max(), forecast_aligned.max())
+      min_val = min(actual.min(), forecast.min())
+      max_val = max(actual.max(), forecast.max())
       ax.plot([min_val, max_val], [min_val, max_val], 
               '--', color=self.colors['baseline'], 
               label='Perfect Forecast')
@@ -106,7 +153,7 @@ class EnergyPlots:
       ax.grid(True, alpha=0.2)
       
       if save:
-          self.save_plot(fig, filename)
+          self.save_plot(fig, filename, save_dir)
       
       return fig
 
@@ -114,7 +161,8 @@ class EnergyPlots:
                           actual: pd.Series,
                           forecast: pd.Series,
                           save: bool = False,
-                          filename: str = 'error_analysis') -> plt.Figure:
+                          filename: str = 'error_analysis',
+                          save_dir: str = 'reports/figures/') -> plt.Figure:
       """Plot error analysis including error distribution and time series."""
       errors = forecast - actual
       
@@ -129,7 +177,7 @@ class EnergyPlots:
       ax1.grid(True, alpha=0.2)
       
       # Error distribution
-      sns.histplot(errors, ax=ax2, color=self.colors['error'])
+      sns.histplot(errors, bins=100, ax=ax2, color=self.colors['error'])
       ax2.axvline(x=0, color=self.colors['baseline'], linestyle='--')
       ax2.set_title('Error Distribution')
       ax2.set_xlabel('Error [MW]')
@@ -139,7 +187,7 @@ class EnergyPlots:
       plt.tight_layout()
       
       if save:
-          self.save_plot(fig, filename)
+          self.save_plot(fig, filename, save_dir)
       
       return fig
 
@@ -147,16 +195,18 @@ class EnergyPlots:
                         actual: pd.Series,
                         forecast: pd.Series,
                         save: bool = False,
-                        filename: str = 'daily_pattern') -> plt.Figure:
+                        filename: str = 'daily_pattern',
+                        save_dir: str = 'reports/figures/') -> plt.Figure:
       """Plot average daily pattern."""
-      actual_hourly = actual.groupby(actual.index.hour).mean()
-      forecast_hourly = forecast.groupby(forecast.index.hour).mean()
+      hours = np.arange(24)
+      actual_hourly = self._bucket_mean(actual, actual.index.hour.to_numpy(), 24)
+      forecast_hourly = self._bucket_mean(forecast, forecast.index.hour.to_numpy(), 24)
       
       fig, ax = plt.subplots(figsize=self.default_figsize)
       
-      ax.plot(actual_hourly.index, actual_hourly, 
+      ax.plot(hours, actual_hourly, 
               label='Actual Load', color=self.colors['actual'])
-      ax.plot(forecast_hourly.index, forecast_hourly, 
+      ax.plot(hours, forecast_hourly, 
               label='Forecast Load', color=self.colors['forecast'])
       
       ax.set_title('Average Daily Load Pattern')
@@ -166,7 +216,7 @@ class EnergyPlots:
       ax.grid(True, alpha=0.2)
       
       if save:
-          self.save_plot(fig, filename)
+          self.save_plot(fig, filename, save_dir)
       
       return fig
 
@@ -174,17 +224,16 @@ class EnergyPlots:
                        actual: pd.Series,
                        forecast: pd.Series,
                        save: bool = False,
-                       filename: str = 'weekly_pattern') -> plt.Figure:
+                       filename: str = 'weekly_pattern',
+                       save_dir: str = 'reports/figures/') -> plt.Figure:
     """Plot weekly pattern analysis."""
-    # Align the data first
-    common_idx = actual.index.intersection(forecast.index)
-    actual = actual[common_idx]
-    forecast = forecast[common_idx]
+    actual, forecast = self._align(actual, forecast)
     
-    # Calculate daily averages
-    actual_daily = actual.groupby(actual.index.dayofweek).mean()
-    forecast_daily = forecast.groupby(forecast.index.dayofweek).mean()
-    errors_daily = abs(forecast - actual).groupby(actual.index.dayofweek).mean()
+    # Calculate daily averages; days without data come out as NaN
+    weekdays = actual.index.dayofweek.to_numpy()
+    actual_daily = self._bucket_mean(actual, weekdays, 7)
+    forecast_daily = self._bucket_mean(forecast, weekdays, 7)
+    errors_daily = self._bucket_mean(abs(forecast - actual), weekdays, 7)
     
     # Create figure
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
@@ -193,9 +242,9 @@ class EnergyPlots:
     days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
     
     # 1. Average Load by Day
-    ax1.plot(days, [actual_daily.get(i, np.nan) for i in range(7)], 
+    ax1.plot(days, actual_daily, 
             'o-', label='Actual Load', color=self.colors['actual'])
-    ax1.plot(days, [forecast_daily.get(i, np.nan) for i in range(7)], 
+    ax1.plot(days, forecast_daily, 
             'o-', label='Forecast Load', color=self.colors['forecast'])
     
     ax1.set_title('Average Daily Load Pattern')
@@ -206,7 +255,7 @@ class EnergyPlots:
     plt.setp(ax1.xaxis.get_majorticklabels(), rotation=45)
     
     # 2. Average Daily Error
-    ax2.bar(days, [errors_daily.get(i, np.nan) for i in range(7)],
+    ax2.bar(days, errors_daily,
             color=self.colors['error'], alpha=0.7)
     ax2.set_title('Average Daily Forecast Error')
     ax2.set_xlabel('Day of Week')
@@ -215,7 +264,7 @@ class EnergyPlots:
     plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45)
     
     # Add data coverage note
-    available_days = sorted(actual_daily.index)
+    available_days = np.flatnonzero(~np.isnan(actual_daily))
     coverage_text = (
         f'Data Coverage: {len(available_days)}/7 days\n'
         f'Available: {", ".join(days[i] for i in available_days)}\n'
@@ -232,7 +281,7 @@ class EnergyPlots:
     plt.subplots_adjust(bottom=0.15)  # Make room for coverage text
     
     if save:
-        self.save_plot(fig, filename)
+        self.save_plot(fig, filename, save_dir)
     
     return fig
 
@@ -240,25 +289,17 @@ class EnergyPlots:
                         actual: pd.Series,
                         forecast: pd.Series,
                         save: bool = False,
-                        filename: str = 'error_heatmap') -> plt.Figure:
+                        filename: str = 'error_heatmap',
+                        save_dir: str = 'reports/figures/') -> plt.Figure:
       """Create heatmap of average absolute errors by hour and day of week."""
-      # Align the data first
-      common_idx = actual.index.intersection(forecast.index)
-      actual = actual[common_idx]
-      forecast = forecast[common_idx]
+      actual, forecast = self._align(actual, forecast)
       
       errors = abs(forecast - actual)
       
-      # Initialize the error matrix with zeros
-      error_matrix = np.zeros((24, 7))
-      counts_matrix = np.zeros((24, 7))
-      
-      # Fill the matrices
-      for idx, error in errors.items():
-          hour = idx.hour
-          day = idx.dayofweek
-          error_matrix[hour, day] += error
-          counts_matrix[hour, day] += 1
+      # Sum errors and counts per (hour, day) cell in one vectorized pass
+      cells = errors.index.hour.to_numpy() * 7 + errors.index.dayofweek.to_numpy()
+      error_matrix = np.bincount(cells, weights=errors.to_numpy(), minlength=168).reshape(24, 7)
+      counts_matrix = np.bincount(cells, minlength=168).reshape(24, 7)
       
       # Calculate averages, avoiding division by zero
       with np.errstate(divide='ignore', invalid='ignore'):
@@ -291,7 +332,7 @@ class EnergyPlots:
       ax.grid(which='minor', color='w', linestyle='-', linewidth=0.5, alpha=0.2)
       
       if save:
-          self.save_plot(fig, filename)
+          self.save_plot(fig, filename, save_dir)
       
       return fig
 
@@ -300,7 +341,8 @@ class EnergyPlots:
                           forecast: pd.Series,
                           window: int = 24,
                           save: bool = False,
-                          filename: str = 'rolling_metrics') -> plt.Figure:
+                          filename: str = 'rolling_metrics',
+                          save_dir: str = 'reports/figures/') -> plt.Figure:
       """Plot rolling mean absolute error and bias."""
       errors = forecast - actual
       abs_errors = abs(errors)
@@ -324,7 +366,7 @@ class EnergyPlots:
       ax.grid(True, alpha=0.2)
       
       if save:
-          self.save_plot(fig, filename)
+          self.save_plot(fig, filename, save_dir)
       
       return fig
 
@@ -333,20 +375,19 @@ class EnergyPlots:
                             forecast: pd.Series,
                             save_dir: str = 'reports/figures/') -> None:
       """Generate and save all plots for analysis."""
-      self.plot_time_series(actual, forecast, save=True, 
-                          filename='time_series')
-      self.plot_distribution(actual, forecast, save=True, 
-                            filename='distribution')
-      self.plot_scatter_comparison(actual, forecast, save=True, 
-                                  filename='scatter')
-      self.plot_error_analysis(actual, forecast, save=True, 
-                              filename='error_analysis')
-      self.plot_daily_pattern(actual, forecast, save=True, 
-                            filename='daily_pattern')
-      #self.plot_weekly_pattern(actual, forecast, save=True, 
-      #                      filename='weekly_pattern')
-      self.plot_error_heatmap(actual, forecast, save=True, 
-                            filename='error_heatmap')
-      self.plot_rolling_metrics(actual, forecast, save=True, 
-                            filename='rolling_metrics')
+      # Align once so every plot works on the same timestamps
+      actual, forecast = self._align(actual, forecast)
+      
+      # Figures are independent and CPU-bound to render, so draw them in parallel
+      tasks = [(method, filename, actual, forecast, save_dir)
+               for method, filename in REPORT_PLOTS.items()]
+      with ProcessPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as pool:
+          list(pool.map(_render_one, tasks))
+
 
+def _render_one(task: Tuple[str, str, pd.Series, pd.Series, str]) -> None:
+  """Render and save one report plot in a worker process."""
+  method, filename, actual, forecast, save_dir = task
+  # Figures are not picklable, so only the saved file leaves the worker
+  getattr(EnergyPlots(), method)(actual, forecast, save=True,
+                                 filename=filename, save_dir=save_dir)
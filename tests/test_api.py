@@ -4,9 +4,16 @@ from scripts.deploy_api import app
 import numpy as np
 from datetime import datetime
 
-client = TestClient(app)
+@pytest.fixture(scope="module")
+def client():
+    # Without an API key the endpoint serves mock data instead of calling ENTSO-E
+    with pytest.MonkeyPatch.context() as mp:
+        mp.delenv('ENTSOE_API_KEY', raising=False)
+        # Entering the context runs the startup handler that loads the model
+        with TestClient(app) as test_client:
+            yield test_client
 
-def test_latest_forecast_endpoint():
+def test_latest_forecast_endpoint(client):
     """Test the /api/latest-forecast endpoint"""
     response = client.get("/api/latest-forecast")
     
@@ -34,7 +41,7 @@ def test_latest_forecast_endpoint():
     except ValueError:
         pytest.fail("Invalid timestamp format")
 
-def test_cors_headers():
+def test_cors_headers(client):
     """Test CORS headers are properly set"""
     response = client.get(
         "/api/latest-forecast",
@@ -0,0 +1,88 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from src.api.batching import PredictBatcher
+
+def run(coro):
+    return asyncio.run(coro)
+
+async def started(predict_fn, **kwargs):
+    batcher = PredictBatcher(predict_fn, **kwargs)
+    batcher.start()
+    return batcher
+
+def test_results_fanned_out_per_request():
+    """Each request gets the predictions for its own rows, in order"""
+    calls = []
+
+    def predict_fn(X):
+        calls.append(len(X))
+        return X[:, 0] * 10
+
+    async def scenario():
+        batcher = await started(predict_fn, max_wait=0.05)
+        requests = [np.full((n, 3), i, dtype=np.float32) for i, n in enumerate([1, 3, 2, 24])]
+        results = await asyncio.gather(*(batcher.submit(features) for features in requests))
+        await batcher.stop()
+        return requests, results
+
+    requests, results = run(scenario())
+
+    # All requests were served by a single model call
+    assert calls == [30]
+    for features, result in zip(requests, results):
+        np.testing.assert_array_equal(result, features[:, 0] * 10)
+
+def test_mismatched_batch_fails_only_its_requests():
+    """A batch that cannot be concatenated fails its own futures and the loop keeps serving"""
+    async def scenario():
+        batcher = await started(lambda X: X[:, 0], max_wait=0.05)
+        failed = await asyncio.gather(
+            batcher.submit(np.ones((2, 3))),
+            batcher.submit(np.ones((2, 4))),
+            return_exceptions=True
+        )
+        served = await asyncio.wait_for(batcher.submit(np.arange(6.0).reshape(2, 3)), timeout=1)
+        await batcher.stop()
+        return failed, served
+
+    failed, served = run(scenario())
+
+    assert all(isinstance(result, ValueError) for result in failed)
+    np.testing.assert_array_equal(served, [0.0, 3.0])
+
+def test_failing_predict_fails_only_its_batch():
+    """An exception from the model reaches that batch's callers only"""
+    calls = []
+
+    def predict_fn(X):
+        calls.append(len(X))
+        if len(calls) == 1:
+            raise RuntimeError("model failed")
+        return X[:, 0]
+
+    async def scenario():
+        batcher = await started(predict_fn, max_wait=0.01)
+        with pytest.raises(RuntimeError, match="model failed"):
+            await batcher.submit(np.ones((1, 3)))
+        served = await asyncio.wait_for(batcher.submit(np.full((1, 3), 5.0)), timeout=1)
+        await batcher.stop()
+        return served
+
+    np.testing.assert_array_equal(run(scenario()), [5.0])
+
+def test_submit_requires_running_batcher():
+    """submit raises instead of hanging when the batcher is not started or stopped"""
+    async def scenario():
+        batcher = PredictBatcher(lambda X: X[:, 0])
+        with pytest.raises(RuntimeError):
+            await batcher.submit(np.ones((1, 3)))
+
+        batcher.start()
+        await batcher.stop()
+        with pytest.raises(RuntimeError):
+            await batcher.submit(np.ones((1, 3)))
+
+    run(scenario())
@@ -1,47 +1,115 @@
-import requests
+import importlib
+import threading
 import time
-from pathlib import Path
-import sys
+from concurrent.futures import ThreadPoolExecutor
 
-# Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.append(str(project_root))
+import numpy as np
+import pandas as pd
+import pytest
 
-from src.dashboard.app import app
-from src.config import Config
+from src.config import Config, TZ
+from src.dashboard import cache
+from src.data.clients.entsoe_client import EntsoeClient
 
-def test_dashboard_availability():
+# 24 hours of actual load followed by 24 hours of forecast, built once for all tests
+_NOW = pd.Timestamp.now(tz=TZ).floor('h')
+_CACHED_ACTUAL = pd.Series(
+    np.linspace(50000, 60000, 24),
+    index=pd.date_range(end=_NOW, periods=24, freq='h')
+)
+_CACHED_FORECAST = pd.Series(
+    np.linspace(60000, 50000, 24),
+    index=pd.date_range(start=_NOW + pd.Timedelta(hours=1), periods=24, freq='h')
+)
+
+@pytest.fixture(scope="module")
+def dashboard():
+    # Serve the fixture series instead of querying ENTSO-E; EntsoeClient uses
+    # __slots__, so the method is patched on the class
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Config, 'ENTSOE_API_KEY', Config.ENTSOE_API_KEY or 'test-key')
+        mp.setattr(
+            EntsoeClient, 'get_load_data',
+            lambda self, hours_back=48, forecast_hours=24: (_CACHED_ACTUAL, _CACHED_FORECAST)
+        )
+        module = importlib.import_module('src.dashboard.app')
+        cache._cache.clear()
+        yield module
+        cache._cache.clear()
+
+@pytest.fixture(scope="module")
+def client(dashboard):
+    return dashboard.app.server.test_client()
+
+def test_dashboard_availability(client):
     """Test if dashboard is accessible"""
-    url = f"http://{Config.DASHBOARD_HOST}:{Config.DASHBOARD_PORT}"
-    try:
-        response = requests.get(url)
-        return response.status_code == 200
-    except requests.ConnectionError:
-        return False
-
-def test_data_updates():
+    response = client.get("/")
+    assert response.status_code == 200
+
+def test_data_updates(dashboard):
     """Test if data updates are working"""
-    client = app.client
-    try:
-        actual_load, forecast_load = client.get_load_data()
-        return len(actual_load) > 0 and len(forecast_load) > 0
-    except Exception as e:
-        print(f"Error: {str(e)}")
-        return False
-
-if __name__ == "__main__":
-    print("Testing dashboard...")
-    
-    # Test 1: Dashboard Availability
-    print("\n1. Testing dashboard availability...")
-    if test_dashboard_availability():
-        print("✓ Dashboard is accessible")
-    else:
-        print("✗ Dashboard is not accessible")
-    
-    # Test 2: Data Updates
-    print("\n2. Testing data updates...")
-    if test_data_updates():
-        print("✓ Data updates are working")
-    else:
-        print("✗ Data updates failed") 
\ No newline at end of file
+    fig, last_update, error = dashboard.update_dashboard(0)
+    assert error == ""
+
+    # The callback patches both traces with the fixture data
+    updates = {
+        tuple(op['location']): op['params']['value']
+        for op in fig.to_plotly_json()['operations']
+    }
+    np.testing.assert_array_equal(updates[('data', 0, 'y')], _CACHED_ACTUAL.to_numpy())
+    np.testing.assert_array_equal(updates[('data', 1, 'y')], _CACHED_FORECAST.to_numpy())
+    assert len(updates[('data', 0, 'x')]) == 24
+
+@pytest.fixture
+def slow_upstream(monkeypatch):
+    """Patch the ENTSO-E fetch with a slow, counting stand-in; the first call can be made to fail"""
+    state = {'calls': 0, 'fail_first': False}
+    leader_started = threading.Event()
+
+    def get_load_data(self, hours_back=48, forecast_hours=24):
+        state['calls'] += 1
+        leader_started.set()
+        time.sleep(0.2)
+        if state['fail_first'] and state['calls'] == 1:
+            raise RuntimeError("upstream failed")
+        return _CACHED_ACTUAL, _CACHED_FORECAST
+
+    monkeypatch.setattr(Config, 'ENTSOE_API_KEY', Config.ENTSOE_API_KEY or 'test-key')
+    monkeypatch.setattr(EntsoeClient, 'get_load_data', get_load_data)
+    cache._cache.clear()
+    yield state, leader_started
+    cache._cache.clear()
+
+def _fetch_concurrently(leader_started, waiters=4):
+    """Start one leading fetch, then more callers while it is in flight"""
+    def fetch():
+        try:
+            return cache.get_cached_data()
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=waiters + 1) as pool:
+        leader = pool.submit(fetch)
+        leader_started.wait(timeout=1)
+        others = [pool.submit(fetch) for _ in range(waiters)]
+        return leader.result(), [future.result() for future in others]
+
+def test_cache_single_flight(slow_upstream):
+    """Concurrent misses produce one upstream call"""
+    state, leader_started = slow_upstream
+    leader, others = _fetch_concurrently(leader_started)
+
+    assert state['calls'] == 1
+    for result in [leader, *others]:
+        assert result[0] is _CACHED_ACTUAL
+
+def test_cache_failed_leader_lets_waiters_retry(slow_upstream):
+    """When the leading fetch fails, a waiter fetches again and all waiters get data"""
+    state, leader_started = slow_upstream
+    state['fail_first'] = True
+    leader, others = _fetch_concurrently(leader_started)
+
+    assert isinstance(leader, RuntimeError)
+    assert state['calls'] == 2
+    for result in others:
+        assert result[0] is _CACHED_ACTUAL